@@ -4,7 +4,7 @@ X-Plane MFD (Multi-Function Display) - Real-time aircraft data visualization
 
 Requirements:
 - Python 3.7+
-- requests library (install with: pip install requests)
+- urllib3 library (install with: pip install urllib3)
 - pygame library (install with: pip install pygame)
 - X-Plane 12.1.1+ running with Web API enabled
 
@@ -35,16 +35,57 @@ Keyboard Shortcuts (fallback when USB device not connected):
 
 import tkinter as tk
 from tkinter import font as tkfont
-import requests
+import urllib3
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional, Any
 import time
 import os
 from pathlib import Path
+import queue
+import select
+import socket
+import struct
 import subprocess
+import threading
+import atexit
 import ctypes
 import ctypes.util
 
+# Persisted name->id dataref map, reused across runs so startup skips
+# one resolution round-trip per dataref
+_DATAREF_CACHE_FILE = Path.home() / ".cache" / "xplane_mfd_datarefs.json"
+
+# How long a failed name lookup stays cached before retrying (seconds)
+_NEGATIVE_CACHE_TTL = 300.0
+
+# X-Plane's legacy UDP interface (RREF dataref subscriptions)
+_XPLANE_UDP_ADDR = ("127.0.0.1", 49000)
+
+# Fixed-size calculator reply record: status + 8 result Float64s
+_CALC_RECORD = struct.Struct("<9d")
+
+# Budget for one calculator worker reply; a worker that misses it is
+# killed and respawned rather than allowed to stall the acquisition loop
+_CALC_REPLY_TIMEOUT = 0.1
+
+# Unit conversion factors used on the per-tick path
+_M_TO_FT = 3.28084
+_MS_TO_KTS = 1.94384
+_KG_TO_LBS = 2.20462
+
+# orjson parses the small numeric API payloads 2-3x faster than stdlib
+# json and accepts bytes directly; fall back when not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Only the joystick subsystem is used; the dummy video driver stops SDL
+# from initializing a display backend (and its threads) at import time
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
 try:
     import pygame.joystick
     PYGAME_AVAILABLE = True
@@ -52,6 +93,14 @@ except ImportError:
     PYGAME_AVAILABLE = False
     print("Warning: pygame not available. Install with: pip install pygame")
 
+# websocket-client enables the push-based dataref stream; without it the
+# MFD keeps using HTTP polling
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
 
 class XPlaneAPI:
     """Interface to X-Plane Web API"""
@@ -59,25 +108,160 @@ class XPlaneAPI:
     def __init__(self, base_url: str = "http://localhost:8086/api/v2"):
         self.base_url = base_url
         self.dataref_cache: Dict[str, int] = {}
-        
+        # One PoolManager for all requests: the TCP connection and headers
+        # are reused across calls instead of a fresh handshake per dataref,
+        # and response.data hands the body straight to the JSON parser as
+        # bytes with no Response-object or UTF-8 decode overhead in between
+        # retries=False: the poll loop retries naturally on the next
+        # tick, so failing fast beats urllib3's built-in retry/backoff
+        self._http = urllib3.PoolManager(
+            num_pools=1, maxsize=4, retries=False,
+            headers={"Accept": "application/json"}
+        )
+        # Latest pushed values by dataref id, fed by the websocket thread
+        self._latest: Dict[int, Any] = {}
+        self._latest_lock = threading.Lock()
+        self._ws = None
+        self._ws_thread = None
+        # UDP RREF subscription state (index -> name, set by start_udp)
+        self._udp_sock = None
+        self._udp_names: Dict[int, str] = {}
+        # Names that resolved to nothing, with the miss timestamp; these
+        # are not re-queried until the TTL expires
+        self.negative_cache: Dict[str, float] = {}
+        self._cache_dirty = False
+        try:
+            cached = json.loads(_DATAREF_CACHE_FILE.read_text())
+            if isinstance(cached, dict):
+                self.dataref_cache.update(cached)
+        except (OSError, ValueError):
+            pass
+        atexit.register(self._save_dataref_cache)
+
+    def _save_dataref_cache(self):
+        """Persist the name->id map for the next launch (tmp + rename)"""
+        if not self._cache_dirty:
+            return
+        try:
+            _DATAREF_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _DATAREF_CACHE_FILE.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.dataref_cache))
+            tmp_path.replace(_DATAREF_CACHE_FILE)
+        except OSError:
+            pass
+
+    def start_websocket(self, names) -> bool:
+        """Subscribe to dataref updates over the Web API websocket
+
+        X-Plane pushes values only when they change, so a live websocket
+        replaces the per-tick HTTP request/response treadmill with
+        in-memory dict lookups. Returns False (callers keep polling) when
+        websocket-client is not installed or no dataref ID resolves.
+        """
+        if not WEBSOCKET_AVAILABLE:
+            return False
+
+        ids = []
+        for name in names:
+            dataref_id = self.get_dataref_id_by_name(name)
+            if dataref_id is not None:
+                ids.append(dataref_id)
+        if not ids:
+            return False
+
+        def on_open(ws):
+            ws.send(json.dumps({
+                "req_id": 1,
+                "type": "dataref_subscribe_values",
+                "params": {"datarefs": [{"id": i} for i in ids]}
+            }))
+
+        def on_message(ws, message):
+            try:
+                data = json.loads(message)
+            except ValueError:
+                return
+            if data.get("type") != "dataref_update_values":
+                return
+            with self._latest_lock:
+                for dataref_id, value in data.get("data", {}).items():
+                    self._latest[int(dataref_id)] = value
+
+        def run_stream():
+            self._ws.run_forever()
+            # run_forever only returns when the stream is over (sim
+            # quit or restarted, network error). Drop the pushed values
+            # immediately: serving them any longer would freeze the
+            # display on stale data while it still reads connected.
+            # Callers fall back to HTTP polling and can re-subscribe
+            with self._latest_lock:
+                self._latest.clear()
+
+        ws_url = "ws" + self.base_url[len("http"):]
+        self._ws = websocket.WebSocketApp(
+            ws_url, on_open=on_open, on_message=on_message
+        )
+        self._ws_thread = threading.Thread(target=run_stream, daemon=True)
+        self._ws_thread.start()
+        return True
+
+    def ws_alive(self) -> bool:
+        """Whether the websocket push stream is still running
+
+        The stream thread exits as soon as run_forever returns, so a
+        dead thread means no more pushes are coming and the caller
+        should go back to polling (and may try to re-subscribe).
+        """
+        return self._ws_thread is not None and self._ws_thread.is_alive()
+
+    def resolve_all(self, names) -> None:
+        """Resolve every name to its ID in one startup pass
+
+        Warming dataref_cache up front means the per-tick path never
+        mixes resolution round-trips into a refresh; with the persisted
+        cache this usually costs zero HTTP requests.
+        """
+        for name in names:
+            self.get_dataref_id_by_name(name)
+
+    def _invalidate_ids(self, names) -> None:
+        """Drop cached IDs so the next lookup re-resolves them
+
+        Dataref IDs are not stable across X-Plane restarts, so the map
+        persisted from a previous session can be stale wholesale; a 404
+        on a value fetch is the signal that an ID no longer exists.
+        """
+        for name in names:
+            if self.dataref_cache.pop(name, None) is not None:
+                self._cache_dirty = True
+
     def get_dataref_id_by_name(self, name: str) -> Optional[int]:
         """Get dataref ID by name, with caching"""
         if name in self.dataref_cache:
             return self.dataref_cache[name]
-        
+
+        # A name that already resolved to nothing (typo, unsupported ref)
+        # would otherwise be re-queried every tick
+        missed_at = self.negative_cache.get(name)
+        if missed_at is not None and time.time() - missed_at < _NEGATIVE_CACHE_TTL:
+            return None
+
         try:
-            response = requests.get(
+            response = self._http.request(
+                "GET",
                 f"{self.base_url}/datarefs",
-                headers={"Accept": "application/json"},
-                params={"filter[name]": name},
-                timeout=1
+                fields={"filter[name]": name},
+                timeout=1.0
             )
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = _json_loads(response.data)
                 if data.get("data") and len(data["data"]) > 0:
                     dataref_id = data["data"][0]["id"]
                     self.dataref_cache[name] = dataref_id
+                    self._cache_dirty = True
                     return dataref_id
+                # X-Plane answered but knows no such dataref
+                self.negative_cache[name] = time.time()
         except Exception as e:
             print(f"Error getting dataref {name}: {e}")
         return None
@@ -89,26 +273,152 @@ class XPlaneAPI:
             return None
         
         try:
-            params = {"index": index} if index is not None else {}
-            response = requests.get(
+            fields = {"index": index} if index is not None else None
+            response = self._http.request(
+                "GET",
                 f"{self.base_url}/datarefs/{dataref_id}/value",
-                headers={"Accept": "application/json"},
-                params=params,
-                timeout=1
+                fields=fields,
+                timeout=1.0
             )
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 200:
+                data = _json_loads(response.data)
                 value = data.get("data")
                 
                 # If requesting array element, X-Plane returns [value], extract it
                 if index is not None and isinstance(value, list) and len(value) > 0:
                     return value[0]
-                
+
                 return value
+            if response.status == 404:
+                # ID from an earlier sim session; drop it so the next
+                # lookup re-resolves the name
+                self._invalidate_ids((name,))
         except Exception as e:
             print(f"Error getting value for {name}: {e}")
         return None
 
+    def get_dataref_values(self, names) -> Dict[str, Any]:
+        """Fetch many datarefs in one combined request
+
+        Resolves any uncached names first, then issues a single
+        GET /datarefs/values?ids=... instead of one HTTP round-trip per
+        dataref. Returns {name: value} for every dataref that came back.
+        Falls back to per-name requests if the combined endpoint fails.
+        """
+        # Push path: with the websocket stream live, the freshest values
+        # are already in memory and this is just a dict rebuild - no HTTP.
+        # The ws_alive check closes the race where the stream died but
+        # its thread has not cleared _latest yet: pushed values are only
+        # trusted while the stream is actually running
+        if self._latest and self.ws_alive():
+            with self._latest_lock:
+                latest = dict(self._latest)
+            values = {}
+            for name in names:
+                dataref_id = self.dataref_cache.get(name)
+                if dataref_id in latest:
+                    values[name] = latest[dataref_id]
+            if values:
+                return values
+
+        # Hot path: IDs are pre-resolved at startup, so this is a plain
+        # dict hit per name with resolution only as a fallback
+        cache_get = self.dataref_cache.get
+        id_to_name = {}
+        for name in names:
+            dataref_id = cache_get(name)
+            if dataref_id is None:
+                dataref_id = self.get_dataref_id_by_name(name)
+            if dataref_id is not None:
+                id_to_name[dataref_id] = name
+
+        if not id_to_name:
+            return {}
+
+        try:
+            response = self._http.request(
+                "GET",
+                f"{self.base_url}/datarefs/values",
+                fields={"ids": ",".join(str(i) for i in id_to_name)},
+                timeout=1.0
+            )
+            if response.status == 200:
+                data = _json_loads(response.data).get("data", {})
+                values = {}
+                for dataref_id, value in data.items():
+                    name = id_to_name.get(int(dataref_id))
+                    if name is not None:
+                        values[name] = value
+                return values
+            if response.status == 404:
+                # At least one ID in the batch is stale (IDs do not
+                # survive a sim restart, so a persisted map can go bad
+                # wholesale). Drop every suspect ID; the per-name
+                # fallback below re-resolves each name fresh and the
+                # fetch recovers within this same call
+                self._invalidate_ids(names)
+        except Exception as e:
+            print(f"Error getting dataref values: {e}")
+
+        # Combined endpoint unavailable - one request per name as before
+        values = {}
+        for name in names:
+            value = self.get_dataref_value(name)
+            if value is not None:
+                values[name] = value
+        return values
+
+    def start_udp(self, names) -> bool:
+        """Subscribe to datarefs over X-Plane's legacy UDP RREF protocol
+
+        The Web API JSON-encodes every value as decimal text that must be
+        parsed float by float; RREF delivers packed little-endian floats
+        that struct.unpack_from decodes in one C-side pass. Used for the
+        engine arrays, where only element 0 is displayed. Returns False
+        (callers keep using JSON) when the subscription cannot be sent.
+        """
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            for idx, name in enumerate(names):
+                request = struct.pack(
+                    "<5sii400s", b"RREF\x00", 10, idx,
+                    f"{name}[0]".encode("ascii")
+                )
+                sock.sendto(request, _XPLANE_UDP_ADDR)
+        except OSError as e:
+            print(f"UDP RREF subscription failed: {e}")
+            return False
+        self._udp_sock = sock
+        self._udp_names = dict(enumerate(names))
+        return True
+
+    def poll_udp(self) -> Dict[str, float]:
+        """Drain pending RREF packets and return {name: value}
+
+        Each packet is a 5-byte "RREF" header followed by repeated
+        (Int32 index, Float32 value) pairs. The socket is non-blocking,
+        so a tick with no pending packets costs one failed recv.
+        """
+        values = {}
+        if self._udp_sock is None:
+            return values
+        try:
+            while True:
+                buf = self._udp_sock.recv(1024)
+                if not buf.startswith(b"RREF"):
+                    continue
+                for offset in range(5, len(buf) - 7, 8):
+                    idx, value = struct.unpack_from("<if", buf, offset)
+                    name = self._udp_names.get(idx)
+                    if name is not None:
+                        values[name] = value
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            print(f"UDP RREF receive failed: {e}")
+        return values
+
 
 class USBDeviceManager:
     """Manager for F16 MFD 2 USB device input using SDL2 joystick API"""
@@ -125,9 +435,16 @@ class USBDeviceManager:
         self.button_callback = button_callback
         self.joystick = None
         self.device_connected = False
-        self.last_button_states = [False] * 28  # F16 MFD 2 has 28 buttons
+        # Button states packed into one int (bit i = button i); rising
+        # edges fall out of bit ops instead of a per-button list compare
+        self._last_mask = 0
         self.sdl = None
-        
+        # Bound once at init so each poll is a direct C call instead of a
+        # ctypes attribute lookup + argument-tuple build per tick
+        self._sdl_update = None
+        self._get_button = None
+        self._nbuttons = 0
+
         if not PYGAME_AVAILABLE:
             print("pygame not available - using keyboard fallback only")
             return
@@ -149,7 +466,14 @@ class USBDeviceManager:
                     print(f"  - Loaded SDL2 from pygame: {sdl_path}")
         except Exception as e:
             print(f"  - Could not load SDL2: {e}")
-        
+
+        if self.sdl is not None:
+            # Resolve the symbol once and declare the signature so ctypes
+            # skips per-call setup on the hot polling path
+            self._sdl_update = self.sdl.SDL_JoystickUpdate
+            self._sdl_update.argtypes = []
+            self._sdl_update.restype = None
+
         # Try to connect to the device
         self.detect_device()
     
@@ -169,15 +493,18 @@ class USBDeviceManager:
                 if device_name == self.TARGET_NAME:
                     joy.init()
                     self.joystick = joy
+                    # Cache button count and the bound method so polling
+                    # skips the per-call attribute lookups
+                    self._nbuttons = joy.get_numbuttons()
+                    self._get_button = joy.get_button
                     self.device_connected = True
                     print(f"✓ F16 MFD 2 detected: {device_name}")
-                    print(f"  - Buttons: {joy.get_numbuttons()}")
+                    print(f"  - Buttons: {self._nbuttons}")
                     print(f"  - Using SDL2 joystick API")
-                    
+
                     # Initialize button states
-                    for btn in range(joy.get_numbuttons()):
-                        self.last_button_states[btn] = False
-                    
+                    self._last_mask = 0
+
                     return True
             
             print("F16 MFD 2 not detected - using keyboard fallback")
@@ -198,28 +525,34 @@ class USBDeviceManager:
         try:
             # Call SDL_JoystickUpdate directly to update joystick state
             # This avoids pygame's event system which conflicts with tkinter
-            if self.sdl:
+            if self._sdl_update is not None:
                 try:
-                    self.sdl.SDL_JoystickUpdate()
+                    self._sdl_update()
                 except Exception as e:
                     pass  # Silently ignore SDL_JoystickUpdate errors
-            
-            # Read button states directly
-            for btn_idx in range(self.joystick.get_numbuttons()):
-                button_pressed = self.joystick.get_button(btn_idx)
-                
-                # Detect button press (transition from not pressed to pressed)
-                if button_pressed and not self.last_button_states[btn_idx]:
-                    # Map button index to panel number (0-9)
-                    if btn_idx <= 9:
-                        print(f"✓ F16 MFD button {btn_idx} pressed → switching to panel {btn_idx}")
-                        self.button_callback(btn_idx)
-                    else:
-                        # Button > 9, just show it was pressed for debugging
-                        print(f"  (F16 MFD button {btn_idx} pressed - not mapped)")
-                
-                self.last_button_states[btn_idx] = button_pressed
-            
+
+            # Pack all button states into one int; rising edges are then
+            # new & ~old, so the common idle poll does no per-button work
+            get_button = self._get_button
+            new_mask = 0
+            for btn_idx in range(self._nbuttons):
+                new_mask |= get_button(btn_idx) << btn_idx
+
+            edges = new_mask & ~self._last_mask
+            while edges:
+                # Lowest set bit = lowest-numbered newly pressed button
+                btn_idx = (edges & -edges).bit_length() - 1
+                # Map button index to panel number (0-9)
+                if btn_idx <= 9:
+                    print(f"✓ F16 MFD button {btn_idx} pressed → switching to panel {btn_idx}")
+                    self.button_callback(btn_idx)
+                else:
+                    # Button > 9, just show it was pressed for debugging
+                    print(f"  (F16 MFD button {btn_idx} pressed - not mapped)")
+                edges &= edges - 1
+
+            self._last_mask = new_mask
+
             return True
             
         except Exception as e:
@@ -246,6 +579,38 @@ class USBDeviceManager:
             pass
 
 
+@lru_cache(maxsize=4096)
+def _fmt_latlon(milli_min: int, is_latitude: bool) -> str:
+    """Format a lat/lon given in thousandths of an arc-minute, with caching
+
+    Position changes slowly between ticks; quantizing at the display's
+    own resolution (0.001', the last digit rendered) lets consecutive
+    ticks hit the cache instead of redoing the degree/minute arithmetic
+    and string formatting, without ever changing the rendered string.
+    """
+    if is_latitude:
+        direction = "N" if milli_min >= 0 else "S"
+    else:
+        direction = "E" if milli_min >= 0 else "W"
+
+    total_min = abs(milli_min) / 1000.0
+    deg = int(total_min // 60)
+    minutes = total_min - deg * 60
+
+    return f"{deg:03d}°{minutes:06.3f}'{direction}"
+
+
+def _first_element(value):
+    """Return element 0 of an array-valued dataref (engine arrays etc.)
+
+    The combined values request returns full arrays where the per-dataref
+    endpoint supported an index parameter.
+    """
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
 class AircraftMFD:
     """Multi-Function Display for X-Plane aircraft data"""
     
@@ -256,7 +621,56 @@ class AircraftMFD:
     DIM_COLOR = "#004400"
     ALERT_COLOR = "#FFAA00"
     WARNING_COLOR = "#FF0000"
-    
+
+    # Every dataref read during a refresh tick, fetched together in one
+    # combined request instead of one HTTP round-trip per name
+    TICK_DATAREFS = (
+        "sim/flightmodel/position/latitude",
+        "sim/flightmodel/position/longitude",
+        "sim/flightmodel/position/elevation",
+        "sim/flightmodel/position/y_agl",
+        "sim/flightmodel/position/psi",
+        "sim/flightmodel/position/theta",
+        "sim/flightmodel/position/phi",
+        "sim/flightmodel/position/hpath",
+        "sim/cockpit2/gauges/indicators/airspeed_kts_pilot",
+        "sim/flightmodel/position/indicated_airspeed",
+        "sim/flightmodel/position/groundspeed",
+        "sim/cockpit2/gauges/indicators/vvi_fpm_pilot",
+        "sim/flightmodel/misc/machno",
+        "sim/cockpit2/engine/indicators/N1_percent",
+        "sim/cockpit2/engine/indicators/N2_percent",
+        "sim/cockpit2/engine/indicators/engine_speed_rpm",
+        "sim/cockpit2/engine/indicators/prop_speed_rpm",
+        "sim/cockpit2/engine/actuators/throttle_ratio",
+        "sim/flightmodel/weight/m_fuel_total",
+        "sim/flightmodel/position/true_airspeed",
+        "sim/flightmodel/weight/m_total",
+        "sim/cockpit2/temperature/outside_air_temp_degc",
+    )
+
+    # Aircraft limits never change in flight - fetched once and cached,
+    # not polled every tick
+    CONST_DATAREFS = (
+        "sim/aircraft/view/acf_Vso",
+        "sim/aircraft/view/acf_Vne",
+        "sim/aircraft/view/acf_Mmo",
+    )
+
+    # Cheap change sentinel: the description changes exactly when a new
+    # aircraft (and with it new limits) is loaded
+    AIRCRAFT_SENTINEL = "sim/aircraft/view/acf_descrip"
+
+    # Array-valued datarefs worth streaming over UDP RREF: the display
+    # only shows element 0, so each is subscribed as "name[0]"
+    ENGINE_ARRAY_DATAREFS = (
+        "sim/cockpit2/engine/indicators/N1_percent",
+        "sim/cockpit2/engine/indicators/N2_percent",
+        "sim/cockpit2/engine/indicators/engine_speed_rpm",
+        "sim/cockpit2/engine/indicators/prop_speed_rpm",
+        "sim/cockpit2/engine/actuators/throttle_ratio",
+    )
+
     def __init__(self, root):
         self.root = root
         self.root.title("X-PLANE MFD")
@@ -266,49 +680,114 @@ class AircraftMFD:
         
         self.api = XPlaneAPI()
         self.is_connected = False
-        self.fields_created = False  # Track if data fields have been created
-        
+        self._ws_started = False  # Websocket subscription attempted yet?
+        self._udp_started = False  # UDP RREF subscription attempted yet?
+
         # Display mode: 0 = all panels, 1-9 = individual panel full screen
         self.display_mode = 0
-        self.panel_map = {
-            1: "POSITION",
-            2: "WIND", 
-            3: "ENVELOPE",
-            4: "NAVIGATION",
-            5: "FLIGHT DATA",
-            6: "ENGINE",
-            7: "TURN PERF",
-            8: "VNAV",
-            9: "DENSITY ALT"
-        }
+        # Indexed by panel number (slot 0 unused): tuple indexing skips
+        # the hashing a dict lookup pays on every key press
+        self.panel_map = (
+            "",
+            "POSITION",
+            "WIND",
+            "ENVELOPE",
+            "NAVIGATION",
+            "FLIGHT DATA",
+            "ENGINE",
+            "TURN PERF",
+            "VNAV",
+            "DENSITY ALT",
+        )
         
         # Error handling
         self.has_cpp_error = False
         self.cpp_error_message = ""
+
+        # Last text written per field, so unchanged values skip the
+        # StringVar.set (and with it the Tk trace + Label redraw)
+        self._last_values: Dict[str, str] = {}
+
+        # Same idea for the status bar labels, which are plain Labels
+        # rather than StringVar-backed fields; the clock dedups on the
+        # integer second so unchanged ticks skip strftime too
+        self._status_text = ""
+        self._last_time_sec = 0
+
+        # Adaptive refresh cadence: back off towards 1 Hz while every
+        # field is stable, snap back to 10 Hz on the first change
+        self._tick_changed = False
+        self._stable_ticks = 0
+        self._interval = 100
+
+        # Render tick counter used to demote slowly-varying fields
+        # (fuel, reference speeds) to a once-per-ten-renders refresh class
+        self._tick = 0
         
+        # Long-lived calculator co-processes by name (spawned on first use)
+        self._calc_procs: Dict[str, Optional[subprocess.Popen]] = {}
+
+        # Per-calculator LRU caches of recent results, keyed by the
+        # quantized request line. The calculators are pure functions of
+        # their inputs, so under stable cruise conditions most ticks
+        # become a dict lookup instead of a pipe round-trip
+        self._calc_cache: Dict[str, OrderedDict] = {
+            name: OrderedDict() for name in self.CALC_BINARIES
+        }
+
+        # Calculator paths and availability resolved once: the binaries
+        # sit next to this script for the process lifetime, so spawn
+        # attempts skip the Path construction and the stat() probe
+        base = Path(__file__).parent
+        self._calc_paths = {
+            name: base / binary for name, binary in self.CALC_BINARIES.items()
+        }
+        self._calc_available = {
+            name: path.exists() for name, path in self._calc_paths.items()
+        }
+
+        # Shared-library entry points, loaded once. A loaded function
+        # replaces the whole subprocess/pipe/parse chain for its
+        # calculator with one C call; missing or unloadable libraries
+        # simply leave that calculator on the worker path
+        self._calc_funcs: Dict[str, Any] = {}
+        self._calc_out: Dict[str, Any] = {}
+        for name, (lib_file, symbol, n_args) in self.CALC_LIB_FUNCS.items():
+            lib_path = base / lib_file
+            if not lib_path.exists():
+                continue
+            try:
+                func = getattr(ctypes.CDLL(str(lib_path)), symbol)
+            except (OSError, AttributeError):
+                continue
+            func.argtypes = (
+                [ctypes.c_double] * n_args + [ctypes.POINTER(ctypes.c_double)]
+            )
+            func.restype = ctypes.c_int32
+            self._calc_funcs[name] = func
+            # One output buffer per calculator, allocated once and
+            # reused every call: only the acquisition thread calls
+            # in-process, and the values are copied into the result
+            # dict before the next call overwrites them
+            self._calc_out[name] = (
+                ctypes.c_double * len(self.CALC_BINARY_KEYS[name])
+            )()
+
         # Initialize USB device manager for F16 MFD 2
         self.usb_device = USBDeviceManager(self.on_usb_button_press)
         
         # Load B612 Mono font
         self.load_custom_fonts()
         
-        # Setup fonts - regular size for all-panels view
+        # Setup fonts - a single shared Font object per role. Every label
+        # references these same objects, so switching between the regular
+        # and large sizes is two Font.configure calls that Tk propagates
+        # itself - no per-label loop and no second set of glyph caches
         self.title_font = tkfont.Font(family=self.font_family, size=14, weight="bold")
         self.data_font = tkfont.Font(family=self.font_family, size=12, weight="bold")
         self.label_font = tkfont.Font(family=self.font_family, size=10)
         self.small_font = tkfont.Font(family=self.font_family, size=8)
-        
-        # Large fonts for single-panel view
-        self.title_font_large = tkfont.Font(family=self.font_family, size=32, weight="bold")
-        self.data_font_large = tkfont.Font(family=self.font_family, size=28, weight="bold")
-        self.label_font_large = tkfont.Font(family=self.font_family, size=22)
-        self.small_font_large = tkfont.Font(family=self.font_family, size=16)
-        
-        # Track all labels for font updates
-        self.header_labels = []
-        self.data_value_labels = []
-        self.data_label_labels = []
-        
+
         # Initialize data variables
         self.init_data_variables()
         
@@ -317,34 +796,62 @@ class AircraftMFD:
         
         # Bind cleanup on window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
-        # Start main update loop (includes USB polling)
+
+        # Acquisition runs on its own thread so a slow HTTP request or a
+        # stalled calculator never freezes the Tk loop; snapshots arrive
+        # through a small queue and stale ones are dropped
+        self._data_queue = queue.Queue(maxsize=2)
+        self._mode_lock = threading.Lock()
+        self._first_error_shown = False
+        self._acq_connected = False  # Acquisition thread's own view
+        # Invariant aircraft-limit cache (acquisition thread only)
+        self._const_cache: Dict[str, Any] = {}
+        self._const_descrip = None
+        self._const_ticks = 0
+        threading.Thread(target=self._acquisition_loop, daemon=True).start()
+
+        # Start main update loop
         self.update_display()
+
+        # USB buttons poll on their own fixed 30 Hz schedule, decoupled
+        # from the adaptive display refresh
+        self._poll_usb()
+
+    def _poll_usb(self):
+        """Poll USB buttons at a fixed 30 Hz, independent of display rate
+
+        Button presses happen on a human timescale, so 30 Hz is plenty;
+        tying the poll to the display loop either wastes SDL calls when
+        refreshing fast or adds input latency when the adaptive interval
+        backs off.
+        """
+        if self.usb_device.is_connected():
+            self.usb_device.poll_buttons_once()
+        self.root.after(33, self._poll_usb)
     
     def load_custom_fonts(self):
         """Load B612 Mono font (Airbus cockpit font)"""
-        try:
-            # Check if B612 Mono is available in system fonts
-            available_fonts = list(tkfont.families())
-            
-            # Try different possible font names
-            possible_names = ["B612 Mono", "B612Mono", "B612 Mono Regular"]
-            
-            for name in possible_names:
-                if name in available_fonts:
+        # Probe the candidate names directly instead of enumerating every
+        # installed family with tkfont.families() - that call walks the
+        # whole system font list and is the slowest part of startup. Tk
+        # silently substitutes a default for unknown families, so check
+        # what the created font actually resolved to
+        possible_names = ["B612 Mono", "B612Mono", "B612 Mono Regular"]
+
+        for name in possible_names:
+            try:
+                probe = tkfont.Font(family=name, size=10)
+                if probe.actual("family") == name:
                     self.font_family = name
                     print(f"Using {name} font")
                     return True
-            
-            # Fall back to Courier if B612 Mono not found
-            print("B612 Mono not found, using Courier as fallback")
-            self.font_family = "Courier"
-            return False
-            
-        except Exception as e:
-            print(f"Error loading fonts: {e}")
-            self.font_family = "Courier"
-            return False
+            except tk.TclError:
+                continue
+
+        # Fall back to Courier if B612 Mono not found
+        print("B612 Mono not found, using Courier as fallback")
+        self.font_family = "Courier"
+        return False
     
     def init_data_variables(self):
         """Initialize all StringVar variables for data display"""
@@ -450,22 +957,45 @@ class AircraftMFD:
         self.vnav_section, self.vnav_frame = self.create_section(self.right_frame, "VNAV")
         self.density_section, self.density_frame = self.create_section(self.right_frame, "DENSITY ALT")
         
-        # Map sections for easy access by panel number
-        self.sections = {
-            1: self.position_section,
-            2: self.wind_section,
-            3: self.envelope_section,
-            4: self.nav_section,
-            5: self.flight_section,
-            6: self.engine_section,
-            7: self.turn_section,
-            8: self.vnav_section,
-            9: self.density_section
-        }
+        # Sections indexed by panel number (slot 0 unused, same layout
+        # as panel_map) - plain tuple indexing on the switch path
+        self.sections = (
+            None,
+            self.position_section,
+            self.wind_section,
+            self.envelope_section,
+            self.nav_section,
+            self.flight_section,
+            self.engine_section,
+            self.turn_section,
+            self.vnav_section,
+            self.density_section,
+        )
         
         self.main_frame.grid_columnconfigure(0, weight=1)
         self.main_frame.grid_columnconfigure(1, weight=1)
         self.main_frame.grid_columnconfigure(2, weight=1)
+
+        # Panels currently packed in their columns; mode switches only
+        # touch sections whose visibility actually changes
+        self._visible_sections = set(range(1, len(self.sections)))
+
+        # Precomputed per-panel layout: (column frame, sibling panels in
+        # that column), indexed by panel number (slot 0 unused).
+        # show_single_panel becomes one tuple index instead of a branch
+        # tree over panel ranges
+        panel_layout = [None]
+        for column_frame, panels in (
+            (self.left_frame, (1, 2, 3)),
+            (self.middle_frame, (4, 5, 6)),
+            (self.right_frame, (7, 8, 9)),
+        ):
+            panel_layout.extend((column_frame, panels) for _ in panels)
+        self._panel_layout = tuple(panel_layout)
+
+        # Column currently expanded to full width (None = 3-column view);
+        # switching panels within one column then skips all grid calls
+        self._fullscreen_column = None
         
         # Create data field rows (only once!)
         self.create_data_fields()
@@ -588,10 +1118,7 @@ class AircraftMFD:
             fg=self.SECONDARY_COLOR
         )
         header.pack(pady=5)
-        
-        # Store reference for font updates
-        self.header_labels.append(header)
-        
+
         # Content frame
         content = tk.Frame(section, bg=self.BG_COLOR)
         content.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -623,11 +1150,7 @@ class AircraftMFD:
             anchor=tk.E
         )
         value_widget.pack(side=tk.RIGHT, fill=tk.X, expand=True)
-        
-        # Store references for font updates
-        self.data_label_labels.append(label_widget)
-        self.data_value_labels.append(value_widget)
-    
+
     def setup_keyboard_bindings(self):
         """Setup keyboard shortcuts for display mode switching"""
         # Bind number keys 0-9
@@ -652,41 +1175,44 @@ class AircraftMFD:
         print("Shutting down...")
         if hasattr(self, 'usb_device'):
             self.usb_device.cleanup()
+        for proc in self._calc_procs.values():
+            if proc is not None and proc.poll() is None:
+                proc.stdin.close()
         self.root.destroy()
     
     def update_font_sizes(self, use_large_fonts: bool):
-        """Update all label fonts based on display mode"""
+        """Resize the shared fonts based on display mode
+
+        Every label references the same Font objects, so resizing them in
+        place restyles the whole display - Tk propagates the change itself
+        """
         if use_large_fonts:
-            # Use large fonts for single-panel view
-            label_font = self.label_font_large
-            data_font = self.data_font_large
+            # Large sizes for single-panel view
+            self.label_font.configure(size=22)
+            self.data_font.configure(size=28)
         else:
-            # Use regular fonts for all-panels view
-            label_font = self.label_font
-            data_font = self.data_font
-        
-        # Update all header labels (section titles)
-        for header in self.header_labels:
-            header.config(font=label_font)
-        
-        # Update all data label labels (field names like "LATITUDE:")
-        for label in self.data_label_labels:
-            label.config(font=label_font)
-        
-        # Update all data value labels (actual values)
-        for value_label in self.data_value_labels:
-            value_label.config(font=data_font)
-    
+            # Regular sizes for all-panels view
+            self.label_font.configure(size=10)
+            self.data_font.configure(size=12)
+
     def switch_display_mode(self, mode: int):
         """Switch between multi-panel and single-panel views"""
         if mode < 0 or mode > 9:
             return
-        
+
+        # Re-selecting the current mode would redo the whole layout pass
+        # for an identical result
+        if mode == self.display_mode:
+            return
+
         # Clear error overlay when switching away from mode 9
         if self.display_mode == 9 and mode != 9:
             self.hide_error_overlay()
-        
-        self.display_mode = mode
+
+        # The acquisition thread reads display_mode for the density
+        # calculator's force-error flag
+        with self._mode_lock:
+            self.display_mode = mode
         
         if mode == 0:
             # Show all panels in 3-column layout
@@ -705,9 +1231,13 @@ class AircraftMFD:
             self.root.title("X-PLANE MFD - ALL PANELS")
             self.keyboard_hint.config(text=f"INPUT: {input_method} | [0-9] Switch Panel | [0] All Panels")
         else:
-            panel_name = self.panel_map.get(mode, "UNKNOWN")
+            panel_name = self.panel_map[mode]
             self.root.title(f"X-PLANE MFD - {panel_name}")
             self.keyboard_hint.config(text=f"INPUT: {input_method} | [{mode}] {panel_name} | [0] Return to All")
+
+        # One deferred layout pass for the whole switch instead of Tk
+        # recomputing geometry after every pack/grid call above
+        self.root.update_idletasks()
     
     def show_all_panels(self):
         """Show all panels in 3-column layout"""
@@ -717,242 +1247,461 @@ class AircraftMFD:
         self.middle_frame.grid(row=0, column=1, sticky="nsew", padx=3, columnspan=1)
         self.right_frame.grid(row=0, column=2, sticky="nsew", padx=3, columnspan=1)
         
-        # Make all sections visible in their original containers
-        for section in self.sections.values():
-            section.pack(fill=tk.BOTH, expand=True, pady=5)
+        # Repack only sections that were hidden - pack() on an already
+        # packed widget still forces a geometry recalculation
+        for num in range(1, len(self.sections)):
+            if num not in self._visible_sections:
+                self.sections[num].pack(fill=tk.BOTH, expand=True, pady=5)
+        self._visible_sections = set(range(1, len(self.sections)))
+        self._fullscreen_column = None
     
     def show_single_panel(self, panel_num: int):
         """Show single panel in full screen"""
-        # Hide all column frames first
-        self.left_frame.grid_remove()
-        self.middle_frame.grid_remove()
-        self.right_frame.grid_remove()
-        
-        # Get the selected section
-        selected_section = self.sections.get(panel_num)
-        if not selected_section:
+        layout = self._panel_layout[panel_num]
+        if layout is None:
             return
-        
-        # Determine which column frame contains this section
-        if panel_num in [1, 2, 3]:
-            # Position, Wind, Envelope - left column
-            self.left_frame.grid(row=0, column=0, sticky="nsew", padx=3, columnspan=3)
-            # Hide other sections in left column
-            for i in [1, 2, 3]:
-                if i == panel_num:
-                    self.sections[i].pack(fill=tk.BOTH, expand=True, pady=5)
-                else:
-                    self.sections[i].pack_forget()
-        elif panel_num in [4, 5, 6]:
-            # Navigation, Flight Data, Engine - middle column
-            self.middle_frame.grid(row=0, column=0, sticky="nsew", padx=3, columnspan=3)
-            # Hide other sections in middle column
-            for i in [4, 5, 6]:
-                if i == panel_num:
-                    self.sections[i].pack(fill=tk.BOTH, expand=True, pady=5)
-                else:
-                    self.sections[i].pack_forget()
-        elif panel_num in [7, 8, 9]:
-            # Turn Perf, VNAV, Density Alt - right column
-            self.right_frame.grid(row=0, column=0, sticky="nsew", padx=3, columnspan=3)
-            # Hide other sections in right column
-            for i in [7, 8, 9]:
-                if i == panel_num:
+
+        column_frame, column_panels = layout
+
+        # Only re-grid when the expanded column actually changes;
+        # switching between panels of the same column is then just a
+        # stacking change with zero grid churn
+        if self._fullscreen_column is not column_frame:
+            self.left_frame.grid_remove()
+            self.middle_frame.grid_remove()
+            self.right_frame.grid_remove()
+            column_frame.grid(row=0, column=0, sticky="nsew", padx=3, columnspan=3)
+            self._fullscreen_column = column_frame
+
+        self._set_column_visibility(panel_num, column_panels)
+
+    def _set_column_visibility(self, panel_num: int, column_panels: tuple):
+        """Show panel_num and hide its column siblings, touching only
+        sections whose packed state actually changes"""
+        for i in column_panels:
+            if i == panel_num:
+                if i not in self._visible_sections:
                     self.sections[i].pack(fill=tk.BOTH, expand=True, pady=5)
-                else:
-                    self.sections[i].pack_forget()
+                    self._visible_sections.add(i)
+            elif i in self._visible_sections:
+                self.sections[i].pack_forget()
+                self._visible_sections.discard(i)
     
     def format_lat_lon(self, degrees: float, is_latitude: bool) -> str:
         """Format latitude/longitude for display"""
         if degrees is None:
             return "---"
-        
-        direction = ""
-        if is_latitude:
-            direction = "N" if degrees >= 0 else "S"
-        else:
-            direction = "E" if degrees >= 0 else "W"
-        
-        degrees = abs(degrees)
-        deg = int(degrees)
-        minutes = (degrees - deg) * 60
-        
-        return f"{deg:03d}°{minutes:06.3f}'{direction}"
-    
-    def calculate_flight_data(self, tas, gs, heading, track, ias, mach, altitude, agl, vs, 
-                              weight, bank, vso, vne, mmo) -> Optional[dict]:
-        """Call C++ flight calculator for comprehensive calculations"""
-        try:
-            script_dir = Path(__file__).parent
-            calculator_path = script_dir / "flight_calculator"
-            
-            if not calculator_path.exists():
-                return None
-            
-            # Call the C++ program with all parameters
-            result = subprocess.run(
-                [str(calculator_path),
-                 str(tas), str(gs), str(heading), str(track),
-                 str(ias), str(mach), str(altitude), str(agl), str(vs),
-                 str(weight), str(bank), str(vso), str(vne), str(mmo)],
-                capture_output=True,
-                text=True,
-                timeout=0.1  # 100ms timeout
-            )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            else:
-                return None
-                
-        except Exception as e:
-            # Silently fail - don't spam console
+        return _fmt_latlon(int(round(degrees * 60000)), is_latitude)
+
+    def _setvar(self, key: str, var: tk.StringVar, text: str) -> None:
+        """Set a StringVar only when its text actually changed
+
+        Every set() fires Tk traces and a Label redraw even for identical
+        text; skipping unchanged values avoids redraws for the many
+        fields that are stable between ticks.
+        """
+        if self._last_values.get(key) != text:
+            var.set(text)
+            self._last_values[key] = text
+            self._tick_changed = True
+
+    def _set_status(self, text: str, fg: str):
+        """Update the status label only when its text actually changed"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_label.config(text=text, fg=fg)
+
+    # Calculator co-process binaries by short name
+    CALC_BINARIES = {
+        "flight": "flight_calculator",
+        "turn": "turn_calculator",
+        "vnav": "vnav_calculator",
+        "density": "density_altitude_calculator",
+    }
+
+    # Request-line templates, built once: a single %-interpolation pass
+    # formats the whole line instead of one format-spec parse per float.
+    # Each field is quantized to just beyond display precision (0.1 kt /
+    # 0.1 deg / 1 ft), so the formatted line doubles as a cache key:
+    # inputs that differ by less than a display step produce the same
+    # line and hit the result cache in calculate_all
+    FLIGHT_REQUEST_FMT = (
+        "%.1f %.1f %.1f %.1f %.1f %.3f %.0f %.0f %.0f %.0f %.1f %.1f %.1f %.3f\n"
+    )
+    TURN_REQUEST_FMT = "%.1f %.1f 90\n"
+    VNAV_REQUEST_FMT = "%.0f 10000.0 100.0 %.1f %.0f\n"
+    DENSITY_REQUEST_FMT = "%.0f %.1f %.1f %.1f %d\n"
+
+    # Per-calculator result cache entries kept before LRU eviction
+    CALC_CACHE_SIZE = 64
+
+    # In-process entry points: library file, exported symbol and number of
+    # Float64 arguments (before the output pointer). The flat calculators
+    # are pure arithmetic, so when their shared library is present each
+    # call is a plain C function call instead of a pipe round-trip; the
+    # flight calculator's nested reply keeps it on the worker path
+    CALC_LIB_FUNCS = {
+        "turn": ("libturn_calculator.so", "turn_performance_compute", 3),
+        "vnav": ("libvnav_calculator.so", "vnav_compute", 5),
+        "density": (
+            "libdensity_altitude_calculator.so", "density_altitude_compute", 4
+        ),
+    }
+
+    # Calculators with flat numeric output answer in binary batch mode:
+    # a fixed record of one status Float64 followed by these fields in
+    # struct order. The flight calculator's nested reply stays JSON.
+    CALC_BINARY_KEYS = {
+        "turn": (
+            "radius_nm", "radius_ft", "turn_rate_dps", "lead_distance_nm",
+            "lead_distance_ft", "time_to_turn_sec", "load_factor",
+            "standard_rate_bank",
+        ),
+        "vnav": (
+            "altitude_to_lose_ft", "flight_path_angle_deg", "required_vs_fpm",
+            "tod_distance_nm", "time_to_constraint_min", "distance_per_1000ft",
+            "vs_for_3deg", "is_descent",
+        ),
+        "density": (
+            "density_altitude_ft", "pressure_altitude_ft", "air_density_ratio",
+            "temperature_deviation_c", "performance_loss_pct", "eas_kts",
+            "tas_to_ias_ratio", "pressure_ratio",
+        ),
+    }
+
+    def _start_calc(self, name: str):
+        """Spawn a calculator as a long-lived co-process
+
+        Every calculator's batch mode reads one case per stdin line and
+        answers with one JSON line, so a single fork+exec serves every
+        refresh tick instead of one per call.
+        """
+        if not self._calc_available[name]:
             return None
-    
-    def calculate_turn_performance(self, tas_kts, bank_deg) -> Optional[dict]:
-        """Call C++ turn calculator"""
+
+        argv = [str(self._calc_paths[name])]
+        if name in self.CALC_BINARY_KEYS:
+            argv.append("--binary")
+
         try:
-            script_dir = Path(__file__).parent
-            calculator_path = script_dir / "turn_calculator"
-            
-            if not calculator_path.exists():
-                return None
-            
-            # Calculate for a 90-degree turn (common reference)
-            result = subprocess.run(
-                [str(calculator_path), str(tas_kts), str(bank_deg), "90"],
-                capture_output=True,
-                text=True,
-                timeout=0.1
+            # Bytes pipes: replies go straight from the pipe to the JSON
+            # parser with no TextIOWrapper decode in between
+            proc = subprocess.Popen(
+                argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
             )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            return None
-        except:
+        except OSError:
+            proc = None
+        self._calc_procs[name] = proc
+        return proc
+
+    def _calc_send(self, name: str, request_line: str):
+        """Write one request line to a calculator worker without waiting
+
+        Returns the worker process for the matching _calc_recv, or None
+        when the calculator is unavailable this tick.
+        """
+        try:
+            proc = self._calc_procs.get(name)
+            if proc is None or proc.poll() is not None:
+                proc = self._start_calc(name)
+                if proc is None:
+                    return None
+
+            proc.stdin.write(request_line.encode("ascii"))
+            return proc
+
+        except Exception:
+            # Silently fail - don't spam console; respawn on next tick
+            self._calc_procs[name] = None
             return None
-    
-    def calculate_vnav_data(self, current_alt_ft, gs_kts, vs_fpm) -> Optional[dict]:
-        """Call C++ VNAV calculator - assumes descent to 10000 ft at 100nm"""
+
+    def _calc_await_reply(self, name: str, proc, deadline: float) -> bool:
+        """Wait for worker output within the reply deadline
+
+        One select() syscall per read - no watcher thread. A worker that
+        misses the deadline is presumed hung: it is killed and dropped so
+        the next tick respawns a fresh one, and this tick's reply becomes
+        None instead of a stalled acquisition loop.
+        """
+        remaining = deadline - time.monotonic()
+        ready, _, _ = select.select([proc.stdout], [], [], max(remaining, 0.0))
+        if ready:
+            return True
+        proc.kill()
+        self._calc_procs[name] = None
+        return False
+
+    def _calc_recv(self, name: str, proc) -> Optional[dict]:
+        """Read and parse one reply from a calculator worker
+
+        Binary-capable calculators answer with a fixed 9-Float64 record
+        (status then fields) decoded in one struct.unpack instead of a
+        text parse; the flight calculator answers with a JSON line.
+        Every read is guarded by the shared reply deadline (see
+        _calc_await_reply).
+        """
+        keys = self.CALC_BINARY_KEYS.get(name)
+        deadline = time.monotonic() + _CALC_REPLY_TIMEOUT
         try:
-            script_dir = Path(__file__).parent
-            calculator_path = script_dir / "vnav_calculator"
-            
-            if not calculator_path.exists():
-                return None
-            
-            # Simplified: show TOD for descent to 10000 ft
-            target_alt = 10000.0
-            distance_nm = 100.0  # Reference distance
-            
-            result = subprocess.run(
-                [str(calculator_path), 
-                 str(current_alt_ft), str(target_alt), str(distance_nm), 
-                 str(gs_kts), str(vs_fpm)],
-                capture_output=True,
-                text=True,
-                timeout=0.1
-            )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout)
+            if keys is None:
+                if not self._calc_await_reply(name, proc, deadline):
+                    return None
+                response = proc.stdout.readline()
+                if not response:
+                    # Calculator exited - drop it and respawn on next tick
+                    self._calc_procs[name] = None
+                    return None
+                return _json_loads(response)
+
+            record = b""
+            while len(record) < _CALC_RECORD.size:
+                if not self._calc_await_reply(name, proc, deadline):
+                    return None
+                chunk = proc.stdout.read(_CALC_RECORD.size - len(record))
+                if not chunk:
+                    # Calculator exited - drop it and respawn on next tick
+                    self._calc_procs[name] = None
+                    return None
+                record += chunk
+
+            fields = _CALC_RECORD.unpack(record)
+            if fields[0] != 0.0:
+                return {"error": int(fields[0])}
+            return dict(zip(keys, fields[1:]))
+
+        except Exception:
+            self._calc_procs[name] = None
             return None
-        except:
+
+    def _calc_inprocess(self, name: str, line: str) -> Optional[dict]:
+        """Run one calculator case in-process via its shared library
+
+        Returns the result dict, or None when the case has to go to the
+        worker instead: no library loaded for this calculator, or the
+        density simulated-error demo, which exercises the worker's
+        in-band error reporting.
+        """
+        func = self._calc_funcs.get(name)
+        if func is None:
             return None
+
+        args = [float(field) for field in line.split()]
+        if name == "density":
+            if args[4]:
+                return None
+            args = args[:4]
+
+        out = self._calc_out[name]
+        status = func(*args, out)
+        if status != 0:
+            return {"error": status}
+        return dict(zip(self.CALC_BINARY_KEYS[name], out))
+
+    def calculate_all(self, requests: Dict[str, str]) -> Dict[str, Optional[dict]]:
+        """Run one tick's calculator requests as a single pipelined batch
+
+        Request lines carry quantized inputs, so a line seen recently is
+        answered from the per-calculator LRU cache; after that the flat
+        calculators run in-process as one C call each when their shared
+        library is loaded. Only what remains (the flight calculator, or
+        any calculator without its library) goes to the workers, where
+        every request line is written before any reply is read so those
+        workers compute concurrently. Returns the parsed reply (or None)
+        per calculator name.
+        """
+        results: Dict[str, Optional[dict]] = {}
+        to_send: Dict[str, str] = {}
+        for name, line in requests.items():
+            cache = self._calc_cache[name]
+            cached = cache.get(line)
+            if cached is not None:
+                cache.move_to_end(line)
+                results[name] = cached
+                continue
+            result = self._calc_inprocess(name, line)
+            if result is not None:
+                results[name] = result
+                cache[line] = result
+                if len(cache) > self.CALC_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                to_send[name] = line
+
+        procs = {
+            name: self._calc_send(name, line)
+            for name, line in to_send.items()
+        }
+        for name, proc in procs.items():
+            result = self._calc_recv(name, proc) if proc is not None else None
+            results[name] = result
+            if result is not None:
+                cache = self._calc_cache[name]
+                cache[to_send[name]] = result
+                if len(cache) > self.CALC_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return results
     
-    def calculate_density_altitude(self, pressure_alt_ft, oat_celsius, ias_kts, tas_kts) -> Optional[dict]:
-        """Call C++ density altitude calculator
-        
-        When display_mode == 9 (viewing DENSITY ALT panel in full screen),
-        this will force the C++ code to throw an exception, demonstrating
-        error handling. A big red X will appear on screen.
+    def _acquire_snapshot(self):
+        """Fetch one tick's worth of data (runs on the acquisition thread)
+
+        Performs all the blocking work - connection test, combined
+        dataref fetch, UDP drain and the calculator batch - and returns
+        (connected, values, calc_results). The data parts are None while
+        disconnected.
         """
+        # Probe the API only while disconnected; once the combined fetch
+        # below is succeeding it doubles as the connection test, so a
+        # connected tick costs one HTTP request instead of two
+        if not self._acq_connected:
+            try:
+                response = self.api._http.request(
+                    "GET", f"{self.api.base_url}/datarefs/count", timeout=1.0
+                )
+                if response.status != 200:
+                    return (False, None, None)
+            except Exception as e:
+                if not self._first_error_shown:
+                    print(f"Connection error: {e}")
+                    self._first_error_shown = True
+                return (False, None, None)
+
+        # Resolve all IDs in one pass, then prefer pushed updates;
+        # polling continues unchanged if that fails
+        if self._ws_started and not self.api.ws_alive():
+            # The push stream died (sim quit or restarted). The HTTP
+            # fallback is already carrying this tick; re-subscribe so
+            # pushes resume once the sim is back
+            self._ws_started = False
+        if not self._ws_started:
+            self.api.resolve_all(self.TICK_DATAREFS)
+            self._ws_started = self.api.start_websocket(self.TICK_DATAREFS)
+        # Binary push for the engine arrays; JSON still covers them if
+        # the subscription fails
+        if not self._udp_started:
+            self._udp_started = self.api.start_udp(self.ENGINE_ARRAY_DATAREFS)
+
         try:
-            script_dir = Path(__file__).parent
-            calculator_path = script_dir / "density_altitude_calculator"
-            
-            if not calculator_path.exists():
-                return None
-            
-            # Force exception when viewing density alt panel in full screen (mode 9)
-            # This demonstrates C++ exception handling and error display
-            force_exception = "1" if self.display_mode == 9 else "0"
-            
-            result = subprocess.run(
-                [str(calculator_path), 
-                 str(pressure_alt_ft), str(oat_celsius), str(ias_kts), str(tas_kts),
-                 force_exception],
-                capture_output=True,
-                text=True,
-                timeout=0.1
-            )
-            
-            if result.returncode == 0:
-                return json.loads(result.stdout)
-            else:
-                # Check if this is an actual exception (return code 1) vs graceful error handling (return code 3)
-                # Return code 1 = uncaught exception (non-compliant version)
-                # Return code 3 = gracefully handled error (compliant version)
-                if self.display_mode == 9 and result.returncode == 1 and not self.has_cpp_error:
-                    # Extract error message from stderr
-                    error_lines = result.stderr.strip().split('\n')
-                    error_msg = "Unknown C++ error"
-                    for line in error_lines:
-                        if line.startswith("Error:"):
-                            error_msg = line.replace("Error:", "").strip()
-                            break
-
-                    # Show error overlay with shutdown notice
-                    self.show_error_overlay(f"{error_msg}\n\nSYSTEM SHUTTING DOWN...")
-
-                    # Quit application after 5 seconds (non-blocking so UI can render)
-                    self.root.after(5000, self.root.quit)
-                    
-                elif self.display_mode == 9 and result.returncode == 3 and not self.has_cpp_error:
-                    error_msg = "Error: Handled error occurred in CDA calculator. Program will no longer crash"
-                    self.show_error_overlay(error_msg)
-                
-                return None
+            # One combined request covers every dataref used this tick
+            values = self.api.get_dataref_values(self.TICK_DATAREFS)
+
+            # Overlay the binary UDP feed for the engine arrays: packed
+            # floats decoded by struct instead of JSON decimal strings
+            values.update(self.api.poll_udp())
+
+            # Aircraft limits come from the cache; revalidate it every
+            # ~10 s instead of refetching them every tick
+            self._const_ticks -= 1
+            if not self._const_cache or self._const_ticks <= 0:
+                self._refresh_const_cache()
+                self._const_ticks = 100
+            values.update(self._const_cache)
+
+            if not values:
+                # Nothing came back - treat as a lost connection and
+                # fall back to probing next tick
+                self._acq_connected = False
+                return (False, None, None)
+
+            calc_results = self.calculate_all(self._build_calc_requests(values))
         except Exception as e:
-            if self.display_mode == 9 and not self.has_cpp_error:
-                self.show_error_overlay(f"Failed to execute calculator: {str(e)}")
-            return None
-    
+            print(f"Error updating data: {e}")
+            self._acq_connected = False
+            return (False, None, None)
+
+        self._acq_connected = True
+        return (True, values, calc_results)
+
+    def _refresh_const_cache(self):
+        """Fetch the invariant aircraft limits, or confirm they still hold
+
+        Compares the aircraft description sentinel first: while it is
+        unchanged the cached Vso/Vne/Mmo stay valid and nothing else is
+        fetched. On an aircraft swap (or an empty cache) the limits are
+        refetched in one combined request.
+        """
+        sentinel = self.api.get_dataref_values(
+            (self.AIRCRAFT_SENTINEL,)
+        ).get(self.AIRCRAFT_SENTINEL)
+
+        if self._const_cache and sentinel == self._const_descrip:
+            return
+
+        fetched = self.api.get_dataref_values(self.CONST_DATAREFS)
+        if fetched:
+            self._const_cache = fetched
+            self._const_descrip = sentinel
+
+    def _acquisition_loop(self):
+        """Background loop feeding snapshots to the Tk thread
+
+        A full queue means the UI has not consumed the last snapshots
+        yet, so the tick is dropped instead of queueing up stale data.
+        """
+        while True:
+            snapshot = self._acquire_snapshot()
+            try:
+                self._data_queue.put_nowait(snapshot)
+            except queue.Full:
+                pass
+            time.sleep(self._interval / 1000.0)
+
     def update_display(self):
-        """Main update loop for the MFD"""
-        # Poll USB device buttons (if connected) - MUST be on main thread for macOS
-        if self.usb_device.is_connected():
-            self.usb_device.poll_buttons_once()
-        
+        """Main update loop for the MFD: render the latest snapshot
+
+        All blocking I/O lives on the acquisition thread; this callback
+        only drains the queue and updates Tk widgets, so the UI stays
+        responsive however slow the sim or the calculators are.
+        """
+        self._tick_changed = False
         try:
-            # Test connection
-            response = requests.get(f"{self.api.base_url}/datarefs/count", timeout=1)
-            if response.status_code == 200:
-                if not self.is_connected:
-                    self.is_connected = True
-                    self.status_label.config(text="● CONNECTED", fg=self.PRIMARY_COLOR)
-                
-                self.update_data()
-            else:
-                if self.is_connected:
-                    self.is_connected = False
-                    self.status_label.config(text="● CONNECTION LOST", fg=self.WARNING_COLOR)
-        except Exception as e:
-            if self.is_connected or not hasattr(self, '_first_error_shown'):
-                print(f"Connection error: {e}")
-                self._first_error_shown = True
+            connected, values, calc_results = self._data_queue.get_nowait()
+        except queue.Empty:
+            connected = None  # No news this tick - keep the current display
+
+        if connected is True:
+            if not self.is_connected:
+                self.is_connected = True
+                self._set_status("● CONNECTED", self.PRIMARY_COLOR)
+            self.update_data(values, calc_results)
+        elif connected is False:
             if self.is_connected:
                 self.is_connected = False
-            self.status_label.config(text="● DISCONNECTED", fg=self.WARNING_COLOR)
-        
-        # Update time display
-        self.time_label.config(text=time.strftime("%H:%M:%S UTC", time.gmtime()))
-        
-        # Schedule next update (10 Hz)
-        self.root.after(100, self.update_display)
+                self._set_status("● CONNECTION LOST", self.WARNING_COLOR)
+            else:
+                self._set_status("● DISCONNECTED", self.WARNING_COLOR)
+
+        # Update time display - the string only changes once a second,
+        # so comparing the integer second first lets most ticks skip the
+        # strftime call as well as the Label reconfigure
+        now = int(time.time())
+        if now != self._last_time_sec:
+            self._last_time_sec = now
+            self.time_label.config(
+                text=time.strftime("%H:%M:%S UTC", time.gmtime(now))
+            )
+
+        # Schedule next update: 10 Hz while values are moving, doubling
+        # up to 1 Hz after every 5 quiet ticks - idle latency is cheap,
+        # idle CPU and network traffic are not
+        if self._tick_changed:
+            self._stable_ticks = 0
+        else:
+            self._stable_ticks += 1
+        self._interval = min(1000, 100 * 2 ** min(self._stable_ticks // 5, 3))
+        self.root.after(self._interval, self.update_display)
     
     def create_data_fields(self):
         """Create all data field labels (called only once during UI setup)"""
+        # Widget creation allocates C-side Tk resources; the fields are
+        # built exactly once here and only their StringVars (and fonts,
+        # via update_font_sizes) change afterwards
+        assert not hasattr(self, '_fields_done')
+        self._fields_done = True
+
         # Position data rows
         self.add_data_row(self.position_frame, "LATITUDE:", self.lat_var)
         self.add_data_row(self.position_frame, "LONGITUDE:", self.lon_var)
@@ -1007,219 +1756,295 @@ class AircraftMFD:
         self.add_data_row(self.density_frame, "ISA DEV:", self.isa_dev_var)
         self.add_data_row(self.density_frame, "EAS:", self.eas_var)
     
-    def update_data(self):
-        """Update all data fields from X-Plane"""
-        try:
-            # Position
-            lat = self.api.get_dataref_value("sim/flightmodel/position/latitude")
-            lon = self.api.get_dataref_value("sim/flightmodel/position/longitude")
-            alt = self.api.get_dataref_value("sim/flightmodel/position/elevation")
-            agl = self.api.get_dataref_value("sim/flightmodel/position/y_agl")
-            
-            if lat is not None:
-                self.lat_var.set(self.format_lat_lon(lat, True))
-            if lon is not None:
-                self.lon_var.set(self.format_lat_lon(lon, False))
-            if alt is not None:
-                self.alt_var.set(f"{alt * 3.28084:.0f} FT")
-            if agl is not None:
-                self.agl_var.set(f"{agl * 3.28084:.0f} FT")
-            
-            # Navigation
-            heading = self.api.get_dataref_value("sim/flightmodel/position/psi")
-            pitch = self.api.get_dataref_value("sim/flightmodel/position/theta")
-            roll = self.api.get_dataref_value("sim/flightmodel/position/phi")
-            track = self.api.get_dataref_value("sim/flightmodel/position/hpath")
-            
-            if heading is not None:
-                self.heading_var.set(f"{heading:06.2f}°")
-            if pitch is not None:
-                self.pitch_var.set(f"{pitch:+06.2f}°")
-            if roll is not None:
-                self.roll_var.set(f"{roll:+06.2f}°")
-            if track is not None:
-                self.track_var.set(f"{track:06.2f}°")
-            
-            # Flight data
-            # Use cockpit gauge IAS (what pilot sees) instead of raw indicated_airspeed
-            # The raw dataref can be miscalibrated or in wrong units for some aircraft
-            ias = self.api.get_dataref_value("sim/cockpit2/gauges/indicators/airspeed_kts_pilot")
-            if ias is None:  # Fallback to raw if cockpit gauge not available
-                ias = self.api.get_dataref_value("sim/flightmodel/position/indicated_airspeed")
-            gs = self.api.get_dataref_value("sim/flightmodel/position/groundspeed")
-            vs = self.api.get_dataref_value("sim/cockpit2/gauges/indicators/vvi_fpm_pilot")
-            mach = self.api.get_dataref_value("sim/flightmodel/misc/machno")
-            
-            if ias is not None:
-                self.ias_var.set(f"{ias:.1f} KTS")
-            if gs is not None:
-                # Convert m/s to knots
-                self.gs_var.set(f"{gs * 1.94384:.1f} KTS")
-            if vs is not None:
-                self.vs_var.set(f"{vs:+.0f} FPM")
-            if mach is not None:
-                self.mach_var.set(f"M {mach:.3f}")
-            
-            # Engine data - try multiple sources for compatibility
-            # Try N1/N2 first (jets)
-            n1 = self.api.get_dataref_value("sim/cockpit2/engine/indicators/N1_percent", 0)
-            n2 = self.api.get_dataref_value("sim/cockpit2/engine/indicators/N2_percent", 0)
-            
-            # If N1/N2 not available, try RPM (props)
-            if n1 is None or n1 == 0:
-                rpm = self.api.get_dataref_value("sim/cockpit2/engine/indicators/engine_speed_rpm", 0)
-                if rpm is not None and rpm > 0:
-                    self.n1_var.set(f"{rpm:.0f} RPM")
-                else:
-                    self.n1_var.set("---")
+    def _build_calc_requests(self, values: Dict[str, Any]) -> Dict[str, str]:
+        """Build one tick's calculator batch from the fetched datarefs
+
+        Every request line is written before any reply is read, so the
+        four workers compute concurrently (see calculate_all).
+        """
+        # One bound method for the run of lookups below; each dotted
+        # values.get would repeat the attribute fetch
+        vals_get = values.get
+
+        alt = vals_get("sim/flightmodel/position/elevation")
+        agl = vals_get("sim/flightmodel/position/y_agl")
+        heading = vals_get("sim/flightmodel/position/psi")
+        roll = vals_get("sim/flightmodel/position/phi")
+        track = vals_get("sim/flightmodel/position/hpath")
+        ias = vals_get("sim/cockpit2/gauges/indicators/airspeed_kts_pilot")
+        if ias is None:
+            ias = vals_get("sim/flightmodel/position/indicated_airspeed")
+        gs = vals_get("sim/flightmodel/position/groundspeed")
+        vs = vals_get("sim/cockpit2/gauges/indicators/vvi_fpm_pilot")
+        mach = vals_get("sim/flightmodel/misc/machno")
+        tas = vals_get("sim/flightmodel/position/true_airspeed")
+        weight = vals_get("sim/flightmodel/weight/m_total")
+        vso = vals_get("sim/aircraft/view/acf_Vso")
+        vne = vals_get("sim/aircraft/view/acf_Vne")
+        mmo_val = vals_get("sim/aircraft/view/acf_Mmo")
+        oat = vals_get("sim/cockpit2/temperature/outside_air_temp_degc")
+
+        # Each SI dataref is converted to the calculators' aviation units
+        # exactly once here; the CLIs stay in kts/ft to match the README,
+        # the test fixtures and hand use
+        alt_ft = alt * _M_TO_FT if alt is not None else 0
+        agl_ft = agl * _M_TO_FT if agl is not None else 0
+        gs_kts = gs * _MS_TO_KTS if gs is not None else 0
+        tas_kts = tas * _MS_TO_KTS if tas is not None else 0
+
+        calc_requests = {}
+
+        # Comprehensive C++ flight calculator
+        if all(v is not None for v in [tas, gs, heading, track, ias, mach, alt, agl, vs, weight, roll, vso, vne, mmo_val]):
+            calc_requests["flight"] = self.FLIGHT_REQUEST_FMT % (
+                tas_kts, gs_kts, heading, track, ias, mach, alt_ft,
+                agl_ft, vs, weight, roll, vso, vne, mmo_val
+            )
+
+        # Turn performance for a 90-degree turn (common reference)
+        if tas is not None and roll is not None:
+            calc_requests["turn"] = self.TURN_REQUEST_FMT % (tas_kts, abs(roll))
+
+        # VNAV, simplified: TOD for descent to 10000 ft at a 100 NM
+        # reference distance
+        if alt_ft is not None and gs_kts is not None and vs is not None:
+            calc_requests["vnav"] = self.VNAV_REQUEST_FMT % (alt_ft, gs_kts, vs)
+
+        # Density altitude. Force an error when viewing the density alt
+        # panel in full screen (mode 9) to demonstrate C++ error
+        # handling - a big red X will appear on screen
+        if oat is not None and alt_ft is not None and ias is not None and tas is not None:
+            with self._mode_lock:
+                force_error = 1 if self.display_mode == 9 else 0
+            calc_requests["density"] = self.DENSITY_REQUEST_FMT % (
+                alt_ft, oat, ias, tas_kts, force_error
+            )
+
+        return calc_requests
+
+    def update_data(self, values: Dict[str, Any], calc_results: Dict[str, Optional[dict]]):
+        """Render one snapshot of dataref values and calculator results
+
+        Pure formatting - every value was fetched and every calculator
+        ran on the acquisition thread, so nothing here is expected to
+        raise; a failure is a rendering bug and should surface, not be
+        swallowed by a blanket except.
+        """
+        # Slow refresh class: fields that drift on a minutes timescale
+        # (fuel, reference speeds) are reformatted once every 10 renders
+        # rather than every tick
+        self._tick += 1
+        slow_tick = self._tick % 10 == 0 or self._tick == 1
+        # Pre-bind the two hot callables: this method makes ~20 value
+        # lookups and ~40 field updates per tick, and a local name skips
+        # the attribute walk each dotted call would repeat
+        vals_get = values.get
+        setvar = self._setvar
+        # Position
+        lat = vals_get("sim/flightmodel/position/latitude")
+        lon = vals_get("sim/flightmodel/position/longitude")
+        alt = vals_get("sim/flightmodel/position/elevation")
+        agl = vals_get("sim/flightmodel/position/y_agl")
+        
+        # Convert each raw value exactly once; the results feed both
+        # the display fields and the calculator calls below
+        alt_ft = alt * _M_TO_FT if alt is not None else 0
+        agl_ft = agl * _M_TO_FT if agl is not None else 0
+
+        if lat is not None:
+            setvar("lat", self.lat_var, self.format_lat_lon(lat, True))
+        if lon is not None:
+            setvar("lon", self.lon_var, self.format_lat_lon(lon, False))
+        if alt is not None:
+            setvar("alt", self.alt_var, f"{alt_ft:.0f} FT")
+        if agl is not None:
+            setvar("agl", self.agl_var, f"{agl_ft:.0f} FT")
+        
+        # Navigation
+        heading = vals_get("sim/flightmodel/position/psi")
+        pitch = vals_get("sim/flightmodel/position/theta")
+        roll = vals_get("sim/flightmodel/position/phi")
+        track = vals_get("sim/flightmodel/position/hpath")
+        
+        if heading is not None:
+            setvar("heading", self.heading_var, f"{heading:06.2f}°")
+        if pitch is not None:
+            setvar("pitch", self.pitch_var, f"{pitch:+06.2f}°")
+        if roll is not None:
+            setvar("roll", self.roll_var, f"{roll:+06.2f}°")
+        if track is not None:
+            setvar("track", self.track_var, f"{track:06.2f}°")
+        
+        # Flight data
+        # Use cockpit gauge IAS (what pilot sees) instead of raw indicated_airspeed
+        # The raw dataref can be miscalibrated or in wrong units for some aircraft
+        ias = vals_get("sim/cockpit2/gauges/indicators/airspeed_kts_pilot")
+        if ias is None:  # Fallback to raw if cockpit gauge not available
+            ias = vals_get("sim/flightmodel/position/indicated_airspeed")
+        gs = vals_get("sim/flightmodel/position/groundspeed")
+        vs = vals_get("sim/cockpit2/gauges/indicators/vvi_fpm_pilot")
+        mach = vals_get("sim/flightmodel/misc/machno")
+        
+        gs_kts = gs * _MS_TO_KTS if gs is not None else 0
+
+        if ias is not None:
+            setvar("ias", self.ias_var, f"{ias:.1f} KTS")
+        if gs is not None:
+            # Convert m/s to knots
+            setvar("gs", self.gs_var, f"{gs_kts:.1f} KTS")
+        if vs is not None:
+            setvar("vs", self.vs_var, f"{vs:+.0f} FPM")
+        if mach is not None:
+            setvar("mach", self.mach_var, f"M {mach:.3f}")
+        
+        # Engine data - try multiple sources for compatibility
+        # Try N1/N2 first (jets)
+        n1 = _first_element(vals_get("sim/cockpit2/engine/indicators/N1_percent"))
+        n2 = _first_element(vals_get("sim/cockpit2/engine/indicators/N2_percent"))
+
+        # If N1/N2 not available, try RPM (props)
+        if n1 is None or n1 == 0:
+            rpm = _first_element(vals_get("sim/cockpit2/engine/indicators/engine_speed_rpm"))
+            if rpm is not None and rpm > 0:
+                setvar("n1", self.n1_var, f"{rpm:.0f} RPM")
             else:
-                self.n1_var.set(f"{n1:.1f}%")
-            
-            if n2 is not None and n2 > 0:
-                self.n2_var.set(f"{n2:.1f}%")
+                setvar("n1", self.n1_var, "---")
+        else:
+            setvar("n1", self.n1_var, f"{n1:.1f}%")
+
+        if n2 is not None and n2 > 0:
+            setvar("n2", self.n2_var, f"{n2:.1f}%")
+        else:
+            # Try prop RPM as alternative
+            prop_rpm = _first_element(vals_get("sim/cockpit2/engine/indicators/prop_speed_rpm"))
+            if prop_rpm is not None and prop_rpm > 0:
+                setvar("n2", self.n2_var, f"{prop_rpm:.0f} RPM")
             else:
-                # Try prop RPM as alternative
-                prop_rpm = self.api.get_dataref_value("sim/cockpit2/engine/indicators/prop_speed_rpm", 0)
-                if prop_rpm is not None and prop_rpm > 0:
-                    self.n2_var.set(f"{prop_rpm:.0f} RPM")
-                else:
-                    self.n2_var.set("---")
-            
-            throttle = self.api.get_dataref_value("sim/cockpit2/engine/actuators/throttle_ratio", 0)
-            if throttle is not None:
-                self.throttle_var.set(f"{throttle * 100:.1f}%")
-            
-            fuel_total = self.api.get_dataref_value("sim/flightmodel/weight/m_fuel_total")
-            if fuel_total is not None:
-                # Convert kg to lbs
-                self.fuel_var.set(f"{fuel_total * 2.20462:.0f} LBS")
-            
-            # Get additional data for comprehensive calculations
-            tas = self.api.get_dataref_value("sim/flightmodel/position/true_airspeed")
-            weight = self.api.get_dataref_value("sim/flightmodel/weight/m_total")
-            vso = self.api.get_dataref_value("sim/aircraft/view/acf_Vso")
-            vne = self.api.get_dataref_value("sim/aircraft/view/acf_Vne")
-            mmo_val = self.api.get_dataref_value("sim/aircraft/view/acf_Mmo")
-            
-            # Convert units for calculator
-            gs_kts = gs * 1.94384 if gs is not None else 0
-            alt_ft = alt * 3.28084 if alt is not None else 0
-            agl_ft = agl * 3.28084 if agl is not None else 0
-            
-            # Call comprehensive C++ flight calculator
-            if all(v is not None for v in [tas, gs, heading, track, ias, mach, alt, agl, vs, weight, roll, vso, vne, mmo_val]):
-                flight_data = self.calculate_flight_data(
-                    tas, gs_kts, heading, track, ias, mach, alt_ft, agl_ft, vs,
-                    weight, roll, vso, vne, mmo_val
-                )
-                
-                if flight_data:
-                    # Extract and display wind data
-                    wind = flight_data.get('wind', {})
-                    hw = wind.get('headwind', 0)
-                    cw = wind.get('crosswind', 0)
-                    wind_spd = wind.get('speed_kts', 0)
-                    wind_dir = wind.get('direction_from', 0)
-                    
-                    if hw >= 0:
-                        self.headwind_var.set(f"{hw:.1f} KT")
-                    else:
-                        self.headwind_var.set(f"{abs(hw):.1f} TAIL")
-                    
-                    if abs(cw) < 0.5:
-                        self.crosswind_var.set("CALM")
-                    elif cw > 0:
-                        self.crosswind_var.set(f"{cw:.1f} R")
-                    else:
-                        self.crosswind_var.set(f"{abs(cw):.1f} L")
-                    
-                    self.wind_spd_var.set(f"{wind_spd:.1f} KT")
-                    self.wind_dir_var.set(f"{wind_dir:03.0f}°")
-                    
-                    # Extract and display envelope margins
-                    envelope = flight_data.get('envelope', {})
-                    stall_mrg = envelope.get('stall_margin_pct', 0)
-                    speed_mrg = envelope.get('min_margin_pct', 0)
-                    load_g = envelope.get('load_factor', 1.0)
-                    corner = envelope.get('corner_speed_kts', 0)
-                    
-                    # Color code stall margin
-                    if stall_mrg < 10:
-                        stall_color = "CRIT"
-                    elif stall_mrg < 20:
-                        stall_color = "WARN"
-                    else:
-                        stall_color = ""
-                    
-                    self.stall_margin_var.set(f"{stall_mrg:.0f}% {stall_color}".strip())
-                    self.speed_margin_var.set(f"{speed_mrg:.0f}%")
-                    self.load_factor_var.set(f"{load_g:.2f} G")
-                    self.corner_spd_var.set(f"{corner:.0f} KT")
-                    
-                    # Extract and display energy data
-                    energy = flight_data.get('energy', {})
-                    spec_energy = energy.get('specific_energy_ft', 0)
-                    trend = energy.get('trend', 0)
-                    
-                    trend_arrow = "↑" if trend > 0 else "↓" if trend < 0 else "→"
-                    self.spec_energy_var.set(f"{spec_energy:.0f} {trend_arrow}")
-            
-            # Call turn performance calculator
-            if tas is not None and roll is not None:
-                turn_data = self.calculate_turn_performance(tas, abs(roll))
-                if turn_data:
-                    radius_nm = turn_data.get('radius_nm', 0)
-                    turn_rate = turn_data.get('turn_rate_dps', 0)
-                    turn_time = turn_data.get('time_to_turn_sec', 0)
-                    std_bank = turn_data.get('standard_rate_bank', 0)
-                    
-                    if radius_nm < 10:
-                        self.turn_radius_var.set(f"{radius_nm:.2f} NM")
-                    else:
-                        self.turn_radius_var.set(f"{radius_nm:.1f} NM")
-                    
-                    self.turn_rate_var.set(f"{turn_rate:.1f} °/s")
-                    self.turn_time_var.set(f"{turn_time:.0f} SEC")
-                    self.std_rate_bank_var.set(f"{std_bank:.1f}°")
-            
-            # Call VNAV calculator
-            if alt_ft is not None and gs_kts is not None and vs is not None:
-                vnav_data = self.calculate_vnav_data(alt_ft, gs_kts, vs)
-                if vnav_data:
-                    tod_dist = vnav_data.get('tod_distance_nm', 0)
-                    req_vs = vnav_data.get('required_vs_fpm', 0)
-                    fpa = vnav_data.get('flight_path_angle_deg', 0)
-                    vs_3deg = vnav_data.get('vs_for_3deg', 0)
-                    
-                    self.tod_dist_var.set(f"{tod_dist:.1f} NM")
-                    self.req_vs_var.set(f"{req_vs:+.0f} FPM")
-                    self.fpa_var.set(f"{fpa:+.1f}°")
-                    self.vs_3deg_var.set(f"{vs_3deg:.0f} FPM")
-            
-            # Call density altitude calculator
-            # Get OAT (outside air temperature)
-            oat = self.api.get_dataref_value("sim/cockpit2/temperature/outside_air_temp_degc")
-            if oat is not None and alt_ft is not None and ias is not None and tas is not None:
-                da_data = self.calculate_density_altitude(alt_ft, oat, ias, tas)
-                if da_data:
-                    dens_alt = da_data.get('density_altitude_ft', 0)
-                    perf_loss = da_data.get('performance_loss_pct', 0)
-                    isa_dev = da_data.get('temperature_deviation_c', 0)
-                    eas = da_data.get('eas_kts', 0)
-                    
-                    self.density_alt_var.set(f"{dens_alt:.0f} FT")
-                    self.perf_loss_var.set(f"{perf_loss:.0f}%")
-                    
-                    # Color code ISA deviation
-                    if abs(isa_dev) < 5:
-                        self.isa_dev_var.set(f"{isa_dev:+.0f}°C")
-                    else:
-                        self.isa_dev_var.set(f"{isa_dev:+.0f}°C !")
-                    
-                    self.eas_var.set(f"{eas:.0f} KT")
+                setvar("n2", self.n2_var, "---")
+
+        throttle = _first_element(vals_get("sim/cockpit2/engine/actuators/throttle_ratio"))
+        if throttle is not None:
+            setvar("throttle", self.throttle_var, f"{throttle * 100:.1f}%")
+
+        fuel_total = vals_get("sim/flightmodel/weight/m_fuel_total")
+        if fuel_total is not None and slow_tick:
+            # Convert kg to lbs
+            setvar("fuel", self.fuel_var, f"{fuel_total * _KG_TO_LBS:.0f} LBS")
+        
+        # The calculators emit every field on every reply, so the
+        # render path indexes them directly instead of paying a
+        # .get() default branch per field; a missing key would mean
+        # a calculator protocol bug worth surfacing, not papering
+        # over with zeros
+        flight_data = calc_results.get("flight")
+        if flight_data and "error" not in flight_data:
+            # Extract and display wind data
+            wind = flight_data['wind']
+            hw = wind['headwind']
+            cw = wind['crosswind']
+            wind_spd = wind['speed_kts']
+            wind_dir = wind['direction_from']
+
+            if hw >= 0:
+                setvar("headwind", self.headwind_var, f"{hw:.1f} KT")
+            else:
+                setvar("headwind", self.headwind_var, f"{abs(hw):.1f} TAIL")
+
+            if abs(cw) < 0.5:
+                setvar("crosswind", self.crosswind_var, "CALM")
+            elif cw > 0:
+                setvar("crosswind", self.crosswind_var, f"{cw:.1f} R")
+            else:
+                setvar("crosswind", self.crosswind_var, f"{abs(cw):.1f} L")
+
+            setvar("wind_spd", self.wind_spd_var, f"{wind_spd:.1f} KT")
+            setvar("wind_dir", self.wind_dir_var, f"{wind_dir:03.0f}°")
+
+            # Extract and display envelope margins
+            envelope = flight_data['envelope']
+            stall_mrg = envelope['stall_margin_pct']
+            speed_mrg = envelope['min_margin_pct']
+            load_g = envelope['load_factor']
+            corner = envelope['corner_speed_kts']
+
+            # Color code stall margin
+            if stall_mrg < 10:
+                stall_color = "CRIT"
+            elif stall_mrg < 20:
+                stall_color = "WARN"
+            else:
+                stall_color = ""
+
+            setvar("stall_margin", self.stall_margin_var, f"{stall_mrg:.0f}% {stall_color}".strip())
+            setvar("speed_margin", self.speed_margin_var, f"{speed_mrg:.0f}%")
+            setvar("load_factor", self.load_factor_var, f"{load_g:.2f} G")
+            if slow_tick:
+                setvar("corner_spd", self.corner_spd_var, f"{corner:.0f} KT")
+
+            # Extract and display energy data
+            energy = flight_data['energy']
+            spec_energy = energy['specific_energy_ft']
+            trend = energy['trend']
+
+            trend_arrow = "↑" if trend > 0 else "↓" if trend < 0 else "→"
+            setvar("spec_energy", self.spec_energy_var, f"{spec_energy:.0f} {trend_arrow}")
+
+        turn_data = calc_results.get("turn")
+        if turn_data and "error" not in turn_data:
+            radius_nm = turn_data['radius_nm']
+            turn_rate = turn_data['turn_rate_dps']
+            turn_time = turn_data['time_to_turn_sec']
+            std_bank = turn_data['standard_rate_bank']
+
+            if radius_nm < 10:
+                setvar("turn_radius", self.turn_radius_var, f"{radius_nm:.2f} NM")
+            else:
+                setvar("turn_radius", self.turn_radius_var, f"{radius_nm:.1f} NM")
+
+            setvar("turn_rate", self.turn_rate_var, f"{turn_rate:.1f} °/s")
+            setvar("turn_time", self.turn_time_var, f"{turn_time:.0f} SEC")
+            if slow_tick:
+                setvar("std_rate_bank", self.std_rate_bank_var, f"{std_bank:.1f}°")
+
+        vnav_data = calc_results.get("vnav")
+        if vnav_data and "error" not in vnav_data:
+            tod_dist = vnav_data['tod_distance_nm']
+            req_vs = vnav_data['required_vs_fpm']
+            fpa = vnav_data['flight_path_angle_deg']
+            vs_3deg = vnav_data['vs_for_3deg']
+
+            setvar("tod_dist", self.tod_dist_var, f"{tod_dist:.1f} NM")
+            setvar("req_vs", self.req_vs_var, f"{req_vs:+.0f} FPM")
+            setvar("fpa", self.fpa_var, f"{fpa:+.1f}°")
+            setvar("vs_3deg", self.vs_3deg_var, f"{vs_3deg:.0f} FPM")
+
+        da_data = calc_results.get("density")
+        if da_data is not None and "error" in da_data:
+            # error code 3 = gracefully handled error (simulated
+            # failure) - show the overlay once in mode 9. Test the
+            # overlay-already-shown flag first: while the overlay is up
+            # this short-circuits before touching the mode or the code
+            if not self.has_cpp_error and self.display_mode == 9 and da_data["error"] == 3:
+                error_msg = "Error: Handled error occurred in CDA calculator. Program will no longer crash"
+                self.show_error_overlay(error_msg)
+            da_data = None
+        if da_data:
+            dens_alt = da_data['density_altitude_ft']
+            perf_loss = da_data['performance_loss_pct']
+            isa_dev = da_data['temperature_deviation_c']
+            eas = da_data['eas_kts']
+
+            setvar("density_alt", self.density_alt_var, f"{dens_alt:.0f} FT")
+            setvar("perf_loss", self.perf_loss_var, f"{perf_loss:.0f}%")
+
+            # Color code ISA deviation
+            if abs(isa_dev) < 5:
+                setvar("isa_dev", self.isa_dev_var, f"{isa_dev:+.0f}°C")
+            else:
+                setvar("isa_dev", self.isa_dev_var, f"{isa_dev:+.0f}°C !")
+
+            setvar("eas", self.eas_var, f"{eas:.0f} KT")
         
-        except Exception as e:
-            print(f"Error updating data: {e}")
 
 
 def main():
@@ -20,11 +20,15 @@
 // Compile: g++ -std=c++20 -O3 -o density_altitude_calculator density_altitude_calculator.cpp
 // 
 // Usage: ./density_altitude_calculator <pressure_alt_ft> <oat_celsius> <ias_kts> <tas_kts> [force_error]
+//        ./density_altitude_calculator            (batch mode: one case per stdin line)
 
 #include <iostream>
+#include <sstream>
+#include <string>
+#include <charconv>
 #include <cmath>
-#include <iomanip>
 #include <cstring>
+#include <cstdio>
 #include <cstdlib>
 #include <vector>
 #include <memory>
@@ -170,23 +174,169 @@ DensityAltitudeData calculate_density_altitude_data(
     return result;
 }
 
+// Print one number in its shortest round-trip form via std::to_chars
+// (Ryu-style): "5000" instead of "5000.00", no trailing zeros. Smaller
+// payloads, and JSON parsers take their integer/short-double fast paths
+void print_number(Float64 value) {
+    char buffer[32];
+    std::to_chars_result conv = std::to_chars(buffer, buffer + sizeof(buffer), value);
+    std::cout.write(buffer, conv.ptr - buffer);
+}
+
 // Output results as JSON
 void print_json(const DensityAltitudeData& da) {
-    std::cout << std::fixed << std::setprecision(2);
     std::cout << "{\n";
-    std::cout << "  \"density_altitude_ft\": " << da.density_altitude_ft << ",\n";
-    std::cout << "  \"pressure_altitude_ft\": " << da.pressure_altitude_ft << ",\n";
-    std::cout << "  \"air_density_ratio\": " << da.air_density_ratio << ",\n";
-    std::cout << "  \"temperature_deviation_c\": " << da.temperature_deviation_c << ",\n";
-    std::cout << "  \"performance_loss_pct\": " << da.performance_loss_pct << ",\n";
-    std::cout << "  \"eas_kts\": " << da.eas_kts << ",\n";
-    std::cout << "  \"tas_to_ias_ratio\": " << da.tas_to_ias_ratio << ",\n";
-    std::cout << "  \"pressure_ratio\": " << da.pressure_ratio << "\n";
+    std::cout << "  \"density_altitude_ft\": ";
+    print_number(da.density_altitude_ft);
+    std::cout << ",\n  \"pressure_altitude_ft\": ";
+    print_number(da.pressure_altitude_ft);
+    std::cout << ",\n  \"air_density_ratio\": ";
+    print_number(da.air_density_ratio);
+    std::cout << ",\n  \"temperature_deviation_c\": ";
+    print_number(da.temperature_deviation_c);
+    std::cout << ",\n  \"performance_loss_pct\": ";
+    print_number(da.performance_loss_pct);
+    std::cout << ",\n  \"eas_kts\": ";
+    print_number(da.eas_kts);
+    std::cout << ",\n  \"tas_to_ias_ratio\": ";
+    print_number(da.tas_to_ias_ratio);
+    std::cout << ",\n  \"pressure_ratio\": ";
+    print_number(da.pressure_ratio);
+    std::cout << "\n}\n";
+}
+
+// Output results as single-line JSON (batch mode: one object per line
+// so callers can match each result to its request)
+void print_json_line(const DensityAltitudeData& da) {
+    std::cout << "{\"density_altitude_ft\": ";
+    print_number(da.density_altitude_ft);
+    std::cout << ", \"pressure_altitude_ft\": ";
+    print_number(da.pressure_altitude_ft);
+    std::cout << ", \"air_density_ratio\": ";
+    print_number(da.air_density_ratio);
+    std::cout << ", \"temperature_deviation_c\": ";
+    print_number(da.temperature_deviation_c);
+    std::cout << ", \"performance_loss_pct\": ";
+    print_number(da.performance_loss_pct);
+    std::cout << ", \"eas_kts\": ";
+    print_number(da.eas_kts);
+    std::cout << ", \"tas_to_ias_ratio\": ";
+    print_number(da.tas_to_ias_ratio);
+    std::cout << ", \"pressure_ratio\": ";
+    print_number(da.pressure_ratio);
     std::cout << "}\n";
 }
 
+// Binary batch record: status code then the eight result fields, all as
+// Float64 so every reply is one fixed-size read for the caller
+const Int32 record_doubles = 9;
+
+void write_binary_record(Float64 status, const DensityAltitudeData* da) {
+    Float64 record[record_doubles] = {status};
+    if (da != nullptr) {
+        record[1] = da->density_altitude_ft;
+        record[2] = da->pressure_altitude_ft;
+        record[3] = da->air_density_ratio;
+        record[4] = da->temperature_deviation_c;
+        record[5] = da->performance_loss_pct;
+        record[6] = da->eas_kts;
+        record[7] = da->tas_to_ias_ratio;
+        record[8] = da->pressure_ratio;
+    }
+    std::fwrite(record, sizeof(Float64), record_doubles, stdout);
+    std::fflush(stdout);
+}
+
+// Batch mode: read one case per line from stdin, emit one reply per case
+// (JSON line, or a raw Float64 record when binary_output is set)
+// Amortizes process startup (fork/exec, loader, libc init) across many cases
+Int32 run_batch_mode(bool binary_output) {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream fields(line);
+        Float64 pressure_altitude_ft;
+        Float64 oat_celsius;
+        Float64 ias_kts;
+        Float64 tas_kts;
+        Int32 force_error = 0;
+        Int32 status = error_success;
+
+        if (!(fields >> pressure_altitude_ft >> oat_celsius >> ias_kts >> tas_kts)) {
+            status = error_parse_failed;
+        } else {
+            // Optional trailing force_error flag (same as argv[5])
+            fields >> force_error;
+
+            if (force_error != 0) {
+                status = error_simulated;
+            } else if (pressure_altitude_ft < min_altitude_ft ||
+                       pressure_altitude_ft > max_altitude_ft ||
+                       oat_celsius < min_temperature_c ||
+                       oat_celsius > max_temperature_c) {
+                status = error_invalid_args;
+            }
+        }
+
+        if (status != error_success) {
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(status), nullptr);
+            } else {
+                std::cout << "{\"error\": " << status << "}\n";
+            }
+        } else {
+            DensityAltitudeData da = calculate_density_altitude_data(
+                pressure_altitude_ft, oat_celsius, ias_kts, tas_kts
+            );
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_success), &da);
+            } else {
+                print_json_line(da);
+            }
+        }
+        // Flush per line so a long-lived caller holding the pipe open
+        // sees each response immediately instead of at buffer-full/exit
+        std::cout.flush();
+    }
+    return error_success;
+}
+
 } // namespace xplane_mfd::calc
 
+// In-process entry point for callers loading this file as a shared library
+// (build with: g++ -std=c++20 -O3 -shared -fPIC -o libdensity_altitude_calculator.so ...)
+// Fills out[8] in the same field order as print_json and returns an error
+// code instead of printing, so no subprocess or JSON round-trip is needed
+extern "C" Int32 density_altitude_compute(
+    Float64 pressure_altitude_ft,
+    Float64 oat_celsius,
+    Float64 ias_kts,
+    Float64 tas_kts,
+    Float64* out
+) {
+    using namespace xplane_mfd::calc;
+
+    Int32 return_code = error_success;
+
+    if (pressure_altitude_ft < min_altitude_ft || pressure_altitude_ft > max_altitude_ft ||
+        oat_celsius < min_temperature_c || oat_celsius > max_temperature_c) {
+        return_code = error_invalid_args;
+    } else {
+        DensityAltitudeData da = calculate_density_altitude_data(
+            pressure_altitude_ft, oat_celsius, ias_kts, tas_kts
+        );
+        out[0] = da.density_altitude_ft;
+        out[1] = da.pressure_altitude_ft;
+        out[2] = da.air_density_ratio;
+        out[3] = da.temperature_deviation_c;
+        out[4] = da.performance_loss_pct;
+        out[5] = da.eas_kts;
+        out[6] = da.tas_to_ias_ratio;
+        out[7] = da.pressure_ratio;
+    }
+
+    return return_code;
+}
+
 void print_usage(const char* program_name) {
     std::cerr << "Usage: " << program_name 
               << " <pressure_alt_ft> <oat_celsius> <ias_kts> <tas_kts> [force_error]\n\n";
@@ -196,6 +346,8 @@ void print_usage(const char* program_name) {
     std::cerr << "  ias_kts        : Indicated airspeed (knots)\n";
     std::cerr << "  tas_kts        : True airspeed (knots)\n";
     std::cerr << "  force_error    : Optional, 1 to simulate error (default: 0)\n\n";
+    std::cerr << "Options:\n";
+    std::cerr << "  --binary       : Emit 8 raw little-endian float64s instead of JSON\n\n";
     std::cerr << "Example:\n";
     std::cerr << "  " << program_name << " 5000 25 150 170\n";
     std::cerr << "  (5000 ft PA, 25°C OAT, 150 kts IAS, 170 kts TAS)\n";
@@ -205,23 +357,42 @@ int main(int argc, char* argv[]) {
     using namespace xplane_mfd::calc;
     
     Int32 return_code = error_success; // hint
-    
+
+    // No arguments: batch mode, cases arrive on stdin one per line.
+    // --binary alone selects the raw Float64 reply framing
+    if (argc == 1) {
+        return run_batch_mode(false);
+    }
+    if (argc == 2 && std::strcmp(argv[1], "--binary") == 0) {
+        return run_batch_mode(true);
+    }
+
+    // Optional --binary flag: emit the 8 result values as raw Float64s
+    // instead of JSON, so callers skip tokenization entirely
+    bool binary_output = false;
+    char** args = argv;
+    if (std::strcmp(argv[1], "--binary") == 0) {
+        binary_output = true;
+        ++args;
+        --argc;
+    }
+
     if (argc != 5 && argc != 6) {
         print_usage(argv[0]);
         return 1;
     }
-    
-    double pressure_altitude_ft = parse_double(argv[1]);
-    double oat_celsius = parse_double(argv[2]);
-    double ias_kts = parse_double(argv[3]);
-    double tas_kts = parse_double(argv[4]);
-    
+
+    double pressure_altitude_ft = parse_double(args[1]);
+    double oat_celsius = parse_double(args[2]);
+    double ias_kts = parse_double(args[3]);
+    double tas_kts = parse_double(args[4]);
+
     // Check for force exception flag
     bool force_exception = false;
     if (argc == 6) {
         force_exception =
-            (std::strcmp(argv[5], "1") == 0 ||
-            std::strcmp(argv[5], "true") == 0);
+            (std::strcmp(args[5], "1") == 0 ||
+            std::strcmp(args[5], "true") == 0);
     }
     
     if (force_exception) {
@@ -243,8 +414,14 @@ int main(int argc, char* argv[]) {
     DensityAltitudeData da = calculate_density_altitude_data(
         pressure_altitude_ft, oat_celsius, ias_kts, tas_kts
     );
-    
-    print_json(da);
+
+    if (binary_output) {
+        // The struct is 8 contiguous Float64s in output order; write them
+        // raw (little-endian on all supported targets)
+        std::fwrite(&da, sizeof(Float64), 8, stdout);
+    } else {
+        print_json(da);
+    }
 
     return error_success;
 }
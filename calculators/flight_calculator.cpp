@@ -19,6 +19,8 @@
 // Compile: g++ -std=c++20 -O3 -o flight_calculator flight_calculator.cpp
 
 #include <iostream>
+#include <sstream>
+#include <string>
 #include <cmath>
 #include <algorithm>
 #include <iomanip>
@@ -365,6 +367,46 @@ void print_json_results(const WindData& wind, const EnvelopeMargins& envelope,
     std::cout << "}\n";
 }
 
+// Output the same structure as single-line JSON (batch mode: one object
+// per line so callers can match each result to its request)
+void print_json_line_results(const WindData& wind, const EnvelopeMargins& envelope,
+                             const EnergyData& energy, const GlideData& glide) {
+    std::cout << std::fixed << std::setprecision(2);
+    std::cout << "{"
+              << "\"wind\": {"
+              << "\"speed_kts\": " << wind.speed_kts << ", "
+              << "\"direction_from\": " << wind.direction_from << ", "
+              << "\"headwind\": " << wind.headwind << ", "
+              << "\"crosswind\": " << wind.crosswind << ", "
+              << "\"gust_factor\": " << wind.gust_factor
+              << "}, "
+              << "\"envelope\": {"
+              << "\"stall_margin_pct\": " << envelope.stall_margin_pct << ", "
+              << "\"vmo_margin_pct\": " << envelope.vmo_margin_pct << ", "
+              << "\"mmo_margin_pct\": " << envelope.mmo_margin_pct << ", "
+              << "\"min_margin_pct\": " << envelope.min_margin_pct << ", "
+              << "\"load_factor\": " << envelope.load_factor << ", "
+              << "\"corner_speed_kts\": " << envelope.corner_speed_kts
+              << "}, "
+              << "\"energy\": {"
+              << "\"specific_energy_ft\": " << energy.specific_energy_ft << ", "
+              << "\"energy_rate_kts\": " << energy.energy_rate_kts << ", "
+              << "\"trend\": " << energy.trend
+              << "}, "
+              << "\"glide\": {"
+              << "\"still_air_range_nm\": " << glide.still_air_range_nm << ", "
+              << "\"wind_adjusted_range_nm\": " << glide.wind_adjusted_range_nm << ", "
+              << "\"glide_ratio\": " << glide.glide_ratio << ", "
+              << "\"best_glide_speed_kts\": " << glide.best_glide_speed_kts
+              << "}, "
+              << "\"alternate_airports\": {"
+              << "\"combinations_5_choose_2\": " << binomial_coefficient(5, 2) << ", "
+              << "\"combinations_10_choose_3\": " << binomial_coefficient(10, 3) << ", "
+              << "\"note\": \"Iterative binomial calculation (JSF-compliant, no recursion)\""
+              << "}"
+              << "}\n";
+}
+
 // A JSF-compliant ring buffer for managing sensor history.
 // AV Rule 206: All memory is contained within the struct and is fixed at compile time.
 struct SensorHistoryBuffer {
@@ -395,6 +437,93 @@ struct SensorHistoryBuffer {
     }
 };
 
+// Run all four calculation groups for one set of inputs and print JSON
+// (multi-line for the argv path, one line per case for batch mode)
+void compute_and_print(
+    Float64 tas_kts,
+    Float64 gs_kts,
+    Float64 heading,
+    Float64 track,
+    Float64 ias_kts,
+    Float64 mach,
+    Float64 altitude_ft,
+    Float64 agl_ft,
+    Float64 vs_fpm,
+    Float64 bank_deg,
+    Float64 vso_kts,
+    Float64 vne_kts,
+    Float64 mmo,
+    bool single_line
+) {
+    // 1. Pre-allocate the buffer at initialization (on the stack).
+    // This happens ONCE. No memory is allocated inside any loops.
+    SensorHistoryBuffer ias_buffer;
+    std::vector<double> ias_history(30);
+
+    for (Int32 i = 0; i < 30; ++i) {
+        Float64 new_reading = 150.0 + (i % 7) - 3.0;
+
+        ias_buffer.add_reading(new_reading);
+        ias_history[i] = new_reading;
+    }
+
+    // ========================================================================
+    // REMOVE BEFORE FLIGHT - Memory allocation, switch function call
+    // ========================================================================
+    WindData wind = calculate_wind_vector(tas_kts, gs_kts, heading, track, ias_history);
+    // WindData wind = calculate_wind_vector(
+    //     tas_kts, gs_kts, heading, track,
+    //     ias_buffer.get_data_ptr(), ias_buffer.get_size()
+    // );
+
+    // 2. Calculate envelope margins
+    EnvelopeMargins envelope = calculate_envelope(
+        bank_deg, ias_kts, mach,
+        vso_kts, vne_kts, mmo
+    );
+
+    // 3. Calculate energy state
+    EnergyData energy = calculate_energy(tas_kts, altitude_ft, vs_fpm);
+
+    // 4. Calculate glide reach
+    GlideData glide = calculate_glide_reach(agl_ft, tas_kts, wind.headwind);
+
+    // Output JSON
+    if (single_line) {
+        print_json_line_results(wind, envelope, energy, glide);
+    } else {
+        print_json_results(wind, envelope, energy, glide);
+    }
+}
+
+// Batch mode: read one case (14 fields) per stdin line, emit one JSON
+// line per case. A long-lived caller pays fork/exec and CRT init once
+// for the whole session instead of once per refresh tick
+Int32 run_batch_mode() {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream fields(line);
+        Float64 tas_kts, gs_kts, heading, track, ias_kts, mach, altitude_ft, agl_ft;
+        Float64 vs_fpm, weight_kg, bank_deg, vso_kts, vne_kts, mmo;
+
+        if (!(fields >> tas_kts >> gs_kts >> heading >> track >> ias_kts >> mach
+                     >> altitude_ft >> agl_ft >> vs_fpm >> weight_kg >> bank_deg
+                     >> vso_kts >> vne_kts >> mmo)) {
+            std::cout << "{\"error\": " << error_parse_failed << "}\n";
+        } else {
+            compute_and_print(
+                tas_kts, gs_kts, heading, track, ias_kts, mach,
+                altitude_ft, agl_ft, vs_fpm, bank_deg, vso_kts, vne_kts,
+                mmo, true
+            );
+        }
+        // Flush per line so the co-process caller sees each response
+        // immediately instead of at buffer-full/exit
+        std::cout.flush();
+    }
+    return error_success;
+}
+
 } // namespace xplane_mfd::calc
 
 // AV Rule 113: Single exit point
@@ -402,7 +531,12 @@ int main(int argc, char* argv[]) {
     using namespace xplane_mfd::calc;
     
     Int32 return_code = error_success;  // Single exit point variable
-    
+
+    // No arguments: batch mode, cases arrive on stdin one per line
+    if (argc == 1) {
+        return run_batch_mode();
+    }
+
     if (argc != 15) {
         std::cerr << "Usage: " << argv[0] << " <tas_kts> <gs_kts> <heading> <track> "
                   << "<ias_kts> <mach> <altitude_ft> <agl_ft> <vs_fpm> "
@@ -451,42 +585,12 @@ int main(int argc, char* argv[]) {
             std::cerr << "Error: Invalid numeric argument\n";
             return_code = error_parse_failed;
         } else {
-            // 1. Pre-allocate the buffer at initialization (on the stack).
-            // This happens ONCE. No memory is allocated inside any loops.
-            SensorHistoryBuffer ias_buffer;
-            std::vector<double> ias_history(30);
-
-            for (Int32 i = 0; i < 30; ++i) {
-                Float64 new_reading = 150.0 + (i % 7) - 3.0;
-                
-                ias_buffer.add_reading(new_reading);
-                ias_history[i] = new_reading;
-            }
-
-            // ========================================================================
-            // REMOVE BEFORE FLIGHT - Memory allocation, switch function call
-            // ========================================================================
-            WindData wind = calculate_wind_vector(tas_kts, gs_kts, heading, track, ias_history);
-            // WindData wind = calculate_wind_vector(
-            //     tas_kts, gs_kts, heading, track,
-            //     ias_buffer.get_data_ptr(), ias_buffer.get_size()
-            // );
-            
-            // 2. Calculate envelope margins
-            EnvelopeMargins envelope = calculate_envelope(
-                bank_deg, ias_kts, mach,
-                vso_kts, vne_kts, mmo
+            compute_and_print(
+                tas_kts, gs_kts, heading, track, ias_kts, mach,
+                altitude_ft, agl_ft, vs_fpm, bank_deg, vso_kts, vne_kts,
+                mmo, false
             );
-            
-            // 3. Calculate energy state
-            EnergyData energy = calculate_energy(tas_kts, altitude_ft, vs_fpm);
-            
-            // 4. Calculate glide reach
-            GlideData glide = calculate_glide_reach(agl_ft, tas_kts, wind.headwind);
-            
-            // Output JSON
-            print_json_results(wind, envelope, energy, glide);
-            
+
             return_code = error_success;
         }
     }
@@ -24,8 +24,12 @@
 #include <iostream>
 #include <cmath>
 #include <iomanip>
+#include <cstdio>
 #include <cstdlib>
+#include <cstring>
 #include <numbers>
+#include <sstream>
+#include <string>
 #include <vector>
 #include "jsf_types.h"
 
@@ -141,8 +145,112 @@ void print_json(const TurnData& turn) {
     std::cout << "}\n";
 }
 
+// Output results as single-line JSON (batch mode: one object per line
+// so callers can match each result to its request)
+void print_json_line(const TurnData& turn) {
+    std::cout << std::fixed << std::setprecision(2);
+    std::cout << "{\"radius_nm\": " << turn.radius_nm
+              << ", \"radius_ft\": " << turn.radius_ft
+              << ", \"turn_rate_dps\": " << turn.turn_rate_dps
+              << ", \"lead_distance_nm\": " << turn.lead_distance_nm
+              << ", \"lead_distance_ft\": " << turn.lead_distance_ft
+              << ", \"time_to_turn_sec\": " << turn.time_to_turn_sec
+              << ", \"load_factor\": " << turn.load_factor
+              << ", \"standard_rate_bank\": " << turn.standard_rate_bank
+              << "}\n";
+}
+
+// Binary batch record: status code then the eight result fields, all as
+// Float64 so every reply is one fixed-size read for the caller
+const Int32 record_doubles = 9;
+
+void write_binary_record(Float64 status, const TurnData* turn) {
+    Float64 record[record_doubles] = {status};
+    if (turn != nullptr) {
+        record[1] = turn->radius_nm;
+        record[2] = turn->radius_ft;
+        record[3] = turn->turn_rate_dps;
+        record[4] = turn->lead_distance_nm;
+        record[5] = turn->lead_distance_ft;
+        record[6] = turn->time_to_turn_sec;
+        record[7] = turn->load_factor;
+        record[8] = turn->standard_rate_bank;
+    }
+    std::fwrite(record, sizeof(Float64), record_doubles, stdout);
+    std::fflush(stdout);
+}
+
+// Batch mode: read one case per line from stdin, emit one reply per case
+// (JSON line, or a raw Float64 record when binary_output is set)
+// Amortizes process startup (fork/exec, loader, libc init) across many cases
+Int32 run_batch_mode(bool binary_output) {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream fields(line);
+        Float64 tas_kts;
+        Float64 bank_deg;
+        Float64 course_change_deg;
+
+        if (!(fields >> tas_kts >> bank_deg >> course_change_deg)) {
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_parse_failed), nullptr);
+            } else {
+                std::cout << "{\"error\": " << error_parse_failed << "}\n";
+            }
+        } else if (tas_kts <= 0.0 || bank_deg < 0.0 || bank_deg > 90.0) {
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_invalid_value), nullptr);
+            } else {
+                std::cout << "{\"error\": " << error_invalid_value << "}\n";
+            }
+        } else {
+            TurnData turn = calculate_turn_performance(tas_kts, bank_deg, course_change_deg);
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_success), &turn);
+            } else {
+                print_json_line(turn);
+            }
+        }
+        // Flush per line so a long-lived caller holding the pipe open
+        // sees each response immediately
+        std::cout.flush();
+    }
+    return error_success;
+}
+
 } // namespace xplane_mfd::calc
 
+// In-process entry point for callers loading this file as a shared library
+// (build with: g++ -std=c++20 -O3 -shared -fPIC -o libturn_calculator.so ...)
+// Fills out[8] in the same field order as print_json and returns an error
+// code instead of printing, so no subprocess or JSON round-trip is needed
+extern "C" Int32 turn_performance_compute(
+    Float64 tas_kts,
+    Float64 bank_deg,
+    Float64 course_change_deg,
+    Float64* out
+) {
+    using namespace xplane_mfd::calc;
+
+    Int32 return_code = error_success;
+
+    if (tas_kts <= 0.0 || bank_deg < 0.0 || bank_deg > 90.0) {
+        return_code = error_invalid_value;
+    } else {
+        TurnData turn = calculate_turn_performance(tas_kts, bank_deg, course_change_deg);
+        out[0] = turn.radius_nm;
+        out[1] = turn.radius_ft;
+        out[2] = turn.turn_rate_dps;
+        out[3] = turn.lead_distance_nm;
+        out[4] = turn.lead_distance_ft;
+        out[5] = turn.time_to_turn_sec;
+        out[6] = turn.load_factor;
+        out[7] = turn.standard_rate_bank;
+    }
+
+    return return_code;
+}
+
 void print_usage(const char* program_name) {
     std::cerr << "Usage: " << program_name 
               << " <tas_kts> <bank_deg> <course_change_deg>\n\n";
@@ -160,7 +268,16 @@ int main(int argc, char* argv[]) {
     using namespace xplane_mfd::calc;
     
     Int32 return_code = error_success;  // Single exit point variable
-    
+
+    // No arguments: batch mode, cases arrive on stdin one per line.
+    // --binary alone selects the raw Float64 reply framing
+    if (argc == 1) {
+        return run_batch_mode(false);
+    }
+    if (argc == 2 && std::strcmp(argv[1], "--binary") == 0) {
+        return run_batch_mode(true);
+    }
+
     // Validate argument count
     if (argc != 4) {
         print_usage(argv[0]);
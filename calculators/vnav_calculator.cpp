@@ -23,8 +23,12 @@
 #include <iostream>
 #include <cmath>
 #include <iomanip>
+#include <cstdio>
 #include <cstdlib>
+#include <cstring>
 #include <numbers>
+#include <sstream>
+#include <string>
 #include <vector>
 #include "jsf_types.h"
 
@@ -135,8 +139,109 @@ void print_json(const VNAVData& vnav) {
     std::cout << "}\n";
 }
 
+// Output results as single-line JSON (batch mode: one object per line
+// so callers can match each result to its request)
+void print_json_line(const VNAVData& vnav) {
+    std::cout << std::fixed << std::setprecision(2);
+    std::cout << "{\"altitude_to_lose_ft\": " << vnav.altitude_to_lose_ft
+              << ", \"flight_path_angle_deg\": " << vnav.flight_path_angle_deg
+              << ", \"required_vs_fpm\": " << vnav.required_vs_fpm
+              << ", \"tod_distance_nm\": " << vnav.tod_distance_nm
+              << ", \"time_to_constraint_min\": " << vnav.time_to_constraint_min
+              << ", \"distance_per_1000ft\": " << vnav.distance_per_1000ft
+              << ", \"vs_for_3deg\": " << vnav.vs_for_3deg
+              << ", \"is_descent\": " << (vnav.is_descent ? "true" : "false")
+              << "}\n";
+}
+
+// Binary batch record: status code then the eight result fields, all as
+// Float64 (is_descent encoded 0.0/1.0) so every reply is one fixed-size
+// read for the caller
+const Int32 record_doubles = 9;
+
+void write_binary_record(Float64 status, const VNAVData* vnav) {
+    Float64 record[record_doubles] = {status};
+    if (vnav != nullptr) {
+        record[1] = vnav->altitude_to_lose_ft;
+        record[2] = vnav->flight_path_angle_deg;
+        record[3] = vnav->required_vs_fpm;
+        record[4] = vnav->tod_distance_nm;
+        record[5] = vnav->time_to_constraint_min;
+        record[6] = vnav->distance_per_1000ft;
+        record[7] = vnav->vs_for_3deg;
+        record[8] = vnav->is_descent ? 1.0 : 0.0;
+    }
+    std::fwrite(record, sizeof(Float64), record_doubles, stdout);
+    std::fflush(stdout);
+}
+
+// Batch mode: read one case per line from stdin, emit one reply per case
+// (JSON line, or a raw Float64 record when binary_output is set)
+// Amortizes process startup (fork/exec, loader, libc init) across many cases
+Int32 run_batch_mode(bool binary_output) {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream fields(line);
+        Float64 current_alt_ft;
+        Float64 target_alt_ft;
+        Float64 distance_nm;
+        Float64 groundspeed_kts;
+        Float64 current_vs_fpm;
+
+        if (!(fields >> current_alt_ft >> target_alt_ft >> distance_nm
+                     >> groundspeed_kts >> current_vs_fpm)) {
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_parse_failed), nullptr);
+            } else {
+                std::cout << "{\"error\": " << error_parse_failed << "}\n";
+            }
+        } else {
+            VNAVData vnav = calculate_vnav(current_alt_ft, target_alt_ft,
+                                           distance_nm, groundspeed_kts, current_vs_fpm);
+            if (binary_output) {
+                write_binary_record(static_cast<Float64>(error_success), &vnav);
+            } else {
+                print_json_line(vnav);
+            }
+        }
+        // Flush per line so a long-lived caller holding the pipe open
+        // sees each response immediately
+        std::cout.flush();
+    }
+    return error_success;
+}
+
 } // namespace xplane_mfd::calc
 
+// In-process entry point for callers loading this file as a shared library
+// (build with: g++ -std=c++20 -O3 -shared -fPIC -o libvnav_calculator.so ...)
+// Fills out[8] in the same field order as print_json (is_descent encoded
+// 0.0/1.0) and returns an error code instead of printing, so no subprocess
+// or JSON round-trip is needed
+extern "C" Int32 vnav_compute(
+    Float64 current_alt_ft,
+    Float64 target_alt_ft,
+    Float64 distance_nm,
+    Float64 groundspeed_kts,
+    Float64 current_vs_fpm,
+    Float64* out
+) {
+    using namespace xplane_mfd::calc;
+
+    VNAVData vnav = calculate_vnav(current_alt_ft, target_alt_ft,
+                                   distance_nm, groundspeed_kts, current_vs_fpm);
+    out[0] = vnav.altitude_to_lose_ft;
+    out[1] = vnav.flight_path_angle_deg;
+    out[2] = vnav.required_vs_fpm;
+    out[3] = vnav.tod_distance_nm;
+    out[4] = vnav.time_to_constraint_min;
+    out[5] = vnav.distance_per_1000ft;
+    out[6] = vnav.vs_for_3deg;
+    out[7] = vnav.is_descent ? 1.0 : 0.0;
+
+    return error_success;
+}
+
 void print_usage(const char* program_name) {
     std::cerr << "Usage: " << program_name 
               << " <current_alt_ft> <target_alt_ft> <distance_nm> <groundspeed_kts> <current_vs_fpm>\n\n";
@@ -156,7 +261,16 @@ int main(int argc, char* argv[]) {
     using namespace xplane_mfd::calc;
     
     Int32 return_code = error_success;  // Single exit point variable
-    
+
+    // No arguments: batch mode, cases arrive on stdin one per line.
+    // --binary alone selects the raw Float64 reply framing
+    if (argc == 1) {
+        return run_batch_mode(false);
+    }
+    if (argc == 2 && std::strcmp(argv[1], "--binary") == 0) {
+        return run_batch_mode(true);
+    }
+
     if (argc != 6) {
         print_usage(argv[0]);
         return_code = error_invalid_args;
@@ -22,6 +22,8 @@
 #include <iomanip>
 #include <cstdlib>
 #include <numbers>
+#include <sstream>
+#include <string>
 #include <vector>
 #include "jsf_types.h"
 
@@ -111,6 +113,45 @@ void print_json(const WindComponents& wind) {
     std::cout << "}\n";
 }
 
+// Output results as single-line JSON (batch mode: one object per line
+// so callers can match each result to its request)
+void print_json_line(const WindComponents& wind) {
+    std::cout << std::fixed << std::setprecision(2);
+    std::cout << "{\"headwind\": " << wind.headwind
+              << ", \"crosswind\": " << wind.crosswind
+              << ", \"total_wind\": " << wind.total_wind
+              << ", \"wca\": " << wind.wca
+              << ", \"drift\": " << wind.drift
+              << "}\n";
+}
+
+// Batch mode: read one case per line from stdin, emit one JSON line per
+// case. Amortizes process startup (fork/exec, loader, libc init) across
+// many cases
+Int32 run_batch_mode() {
+    std::string line;
+    while (std::getline(std::cin, line)) {
+        std::istringstream fields(line);
+        Float64 track;
+        Float64 heading;
+        Float64 wind_dir;
+        Float64 wind_speed;
+
+        if (!(fields >> track >> heading >> wind_dir >> wind_speed)) {
+            std::cout << "{\"error\": " << error_parse_failed << "}\n";
+        } else if (wind_speed < wind_calm_threshold) {
+            std::cout << "{\"error\": " << error_invalid_value << "}\n";
+        } else {
+            WindComponents wind = calculate_wind(track, heading, wind_dir, wind_speed);
+            print_json_line(wind);
+        }
+        // Flush per line so a long-lived caller holding the pipe open
+        // sees each response immediately
+        std::cout.flush();
+    }
+    return error_success;
+}
+
 } // namespace xplane_mfd::calc
 
 void print_usage(const char* program_name) {
@@ -131,7 +172,12 @@ int main(int argc, char* argv[]) {
     using namespace xplane_mfd::calc;
     
     Int32 return_code = error_success;  // Single exit point variable
-    
+
+    // No arguments: batch mode, cases arrive on stdin one per line
+    if (argc == 1) {
+        return run_batch_mode();
+    }
+
     // JSF-compliant: No exceptions, use error codes
     if (argc != 5) {
         print_usage(argv[0]);